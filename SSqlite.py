@@ -1,12 +1,32 @@
+import array
+import asyncio
 import base64
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hmac
+import itertools
+import operator
+import queue
+import re
 import sqlite3
+import sys
+import threading
+import time
 import typing as t
+import zlib
 import datetime
 from enum import IntEnum
-from hashlib import sha512
+from hashlib import sha256, sha512
+
+try:
+    import numpy as np
+except ImportError: # optional, only used to vectorize hot loops
+    np = None
 
 xInputDataT = t.Union[t.List[t.Dict[str, t.Any]], t.Dict[str, t.Any]]
-xResponseValueT = t.Optional[t.Union[t.List[t.Dict[str, t.Any]], t.Dict[str, t.Any], int]]
+xResponseValueT = t.Optional[t.Union[t.List[t.Dict[str, t.Any]], t.Dict[str, t.Any], t.Iterator[t.Dict[str, t.Any]], int]]
 BOOL = ["BOOLEAN", "BOOL"]
 INTEGERS = ["INT","INTEGER", "TINYINT", "SMALLINT", "MEDIUMINT", "BIGINT", "UNSIGNED BIG INT"]
 REAL = ["REAL", "DOUBLE", "DOUBLE PRECISION", "FLOAT"]
@@ -14,88 +34,695 @@ DATE = ["DATE", "DATETIME", "TIME"]
 TEXT = ["TEXT"]
 LOOKUP = {x: int for x in INTEGERS} | {x: float for x in REAL} | {x: bool for x in BOOL} | {x: str for x in TEXT}
 ALL = sum((BOOL, INTEGERS, REAL, DATE, TEXT), [])
+PROFILES: t.Dict[str, t.Dict[str, t.Union[str, int]]] = { # PRAGMAs applied once per pooled connection
+    "durable": {"busy_timeout": 5000, "journal_mode": "WAL", "synchronous": "FULL", "cache_size": -16_000, "mmap_size": 0, "temp_store": "DEFAULT"},
+    "balanced": {"busy_timeout": 5000, "journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -64_000, "mmap_size": 256 * 2**20, "temp_store": "MEMORY"},
+    "throughput": {"busy_timeout": 10000, "journal_mode": "WAL", "synchronous": "OFF", "cache_size": -256_000, "mmap_size": 2**30, "temp_store": "MEMORY"},
+    "readonly": {"busy_timeout": 5000, "query_only": 1, "cache_size": -64_000, "mmap_size": 2**30, "temp_store": "MEMORY"},
+}
+
+def _chunked(iterable: t.Iterable[t.Any], size: int) -> t.Iterator[t.List[t.Any]]:
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+def _insert_sql(table: str, keys: t.Sequence[str], conflict_column: t.Optional[str] = None) -> str:
+    if not keys:
+        return f"INSERT INTO {table} DEFAULT VALUES;"
+    sql = f"INSERT INTO {table} ({', '.join(keys)}) VALUES ({', '.join('?' * len(keys))})"
+    if conflict_column is not None:
+        updates = ", ".join([f"{x} = excluded.{x}" for x in keys if x != conflict_column])
+        sql += f" ON CONFLICT({conflict_column}) DO {'UPDATE SET ' + updates if updates else 'NOTHING'}"
+    return sql + ";"
+
+CODECS = ["plain", "b64", "secure", "compressed"]
+CODEC_TABLE = "_ssqlite_codecs" # per-column codecs declared at table creation
+BLIND_SUFFIX = "__bidx" # shadow column holding the keyed hash of an encrypted column
+OPERATORS = {"eq": "=", "ne": "!=", "lt": "<", "lte": "<=", "gt": ">", "gte": ">=", "like": "LIKE", "in": "IN", "not_in": "NOT IN", "is_null": "IS NULL"}
+
+def _split_predicate(key: str) -> t.Tuple[str, str]:
+    column, sep, op = key.rpartition("__")
+    return (column, op) if sep and op in OPERATORS else (key, "eq")
+
+def _where_sql(shape: t.Sequence[t.Tuple[str, str, int]]) -> str:
+    conditions = []
+    for column, op, arity in shape:
+        if op in ("in", "not_in"):
+            conditions.append(f"{column} {OPERATORS[op]} ({', '.join('?' * arity)})" if arity else "0" if op == "in" else "1")
+        elif op == "is_null":
+            conditions.append(f"{column} IS {'' if arity else 'NOT '}NULL")
+        else:
+            conditions.append(f"{column} {OPERATORS[op]} ?")
+    return " AND ".join(conditions)
+
+def _delete_in_sql(table: str, keys: t.Sequence[str], count: int) -> str:
+    if len(keys) == 1:
+        return f"DELETE FROM {table} WHERE {keys[0]} IN ({', '.join('?' * count)});"
+    placeholder = f"({', '.join('?' * len(keys))})"
+    return f"DELETE FROM {table} WHERE ({', '.join(keys)}) IN (VALUES {', '.join([placeholder] * count)});"
+
+def _to_datetime(obj: str | int | float) -> datetime.datetime:
+    if isinstance(obj, str): # probably isoformat
+        if obj.isnumeric(): # str'ed timestamp probably
+            return datetime.datetime.fromtimestamp(float(obj))
+        return datetime.datetime.fromisoformat(obj) # let error raise if smth goes wrong
+    elif isinstance(obj, (int, float)): # timestamp probably
+        return datetime.datetime.fromtimestamp(obj)
+    raise ValueError("Incorrect arg")
+
+def _to_bool(obj: t.Any) -> bool:
+    if isinstance(obj, str): # decoded from secure/b64 text
+        return obj not in ("", "0", "False")
+    return not not obj
+
+def _cast(decltype: t.Optional[str]) -> t.Optional[t.Callable[[t.Any], t.Any]]:
+    if decltype in INTEGERS:
+        return int
+    elif decltype in REAL:
+        return float
+    elif decltype in BOOL:
+        return _to_bool
+    elif decltype in DATE:
+        return _to_datetime
+    return None
+
+def _identity(obj: t.Any) -> t.Any:
+    return obj
+
+def _compile_decoder(
+    names: t.Sequence[str], 
+    decltypes: t.Sequence[t.Optional[str]], 
+    decodes: t.Sequence[t.Optional[t.Callable[[t.Any], t.Any]]]
+) -> t.Callable[[t.Sequence[t.Any]], t.Dict[str, t.Any]]:
+    """Generates a row decoder with every column's conversion inlined at its tuple position."""
+    env: t.Dict[str, t.Any] = {}
+    cells = []
+    for x, (name, decltype, decode) in enumerate(zip(names, decltypes, decodes)):
+        env[f"decode{x}"] = decode
+        expr = f"v{x}" if decode is None else f"decode{x}(v{x})"
+        if (cast := _cast(decltype)) is not None:
+            env[f"cast{x}"] = cast
+            expr = f"cast{x}({expr})"
+        cells.append(f"{name!r}: v{x}" if expr == f"v{x}" else f"{name!r}: None if v{x} is None else {expr}")
+    exec(f"def decoder(row):\n    {', '.join([f'v{x}' for x in range(len(cells))])}, = row\n    return {{{', '.join(cells)}}}", env)
+    return env["decoder"]
+
+def _check_date(obj: t.Any) -> None:
+    if isinstance(obj, str):
+        if not obj.isnumeric():
+            datetime.datetime.fromisoformat(obj)
+    else:
+        datetime.datetime.fromtimestamp(float(obj))
+
+def _compile_validator(columns: t.Dict[str, str]) -> t.Callable[[t.Iterable[t.Dict[str, t.Any]]], t.List["RowError"]]:
+    """Builds a validator for one table schema, checking every row of the input."""
+    types = {x: LOOKUP[y] for x, y in columns.items() if y in LOOKUP}
+    dates = {x for x, y in columns.items() if y in DATE}
+    def validate(rows: t.Iterable[t.Dict[str, t.Any]]) -> t.List[RowError]:
+        errors = []
+        for index, row in enumerate(rows):
+            for column, value in row.items():
+                if (expected := types.get(column)) is not None:
+                    if not isinstance(value, expected):
+                        errors.append(RowError(index, column, value, f"type mismatch for value {value} which must be type of {expected}"))
+                elif column in dates:
+                    try:
+                        _check_date(value)
+                    except (ValueError, TypeError, OverflowError, OSError) as e:
+                        errors.append(RowError(index, column, value, f"invalid date value {value}: {e}"))
+                elif column not in columns:
+                    errors.append(RowError(index, column, value, f"no such column: {column}"))
+        return errors
+    return validate
 
 class Abc:
     """Basic Encryption support"""
     def __init__(self, key: str, hashmethod: t.Callable[[bytes], t.Any] = sha512) -> None:
-        self.__key = hashmethod(key.encode()).hexdigest()
+        self._derive(hashmethod(key.encode()).hexdigest())
+    
+    @classmethod
+    def from_key(cls, key: str) -> "Abc":
+        """Rebuilds a cipher from an already hashed ``key``, the password itself never leaves the process."""
+        abc = cls.__new__(cls)
+        abc._derive(key)
+        return abc
+    
+    def _derive(self, key: str) -> None:
+        self.__key = key
+        # the original per-character loop grew the key as key + key[::-1] until it covered
+        # the message, which is exactly cycling over this doubled key, so build it once
+        self._period = [x * 27 for x in map(ord, self.__key + self.__key[::-1])]
+        self._period_array = np.array(self._period, dtype=np.int64) if np is not None else None
+        self._period_bytes = (self.__key + self.__key[::-1]).encode()
     
     @property
     def key(self):
         return self.__key
     
+    def _shift(self, message: str, sign: int) -> str:
+        if self._period_array is not None and len(message) >= 64: # numpy call overhead beats the loop on short values
+            codes = np.frombuffer(message.encode("utf-32-le", "surrogatepass"), dtype=np.uint32).astype(np.int64)
+            codes = np.abs(codes + sign * np.resize(self._period_array, len(codes)))
+            return codes.astype(np.uint32).tobytes().decode("utf-32-le", "surrogatepass")
+        shifted = map(operator.add if sign > 0 else operator.sub, map(ord, message), itertools.cycle(self._period))
+        return "".join(map(chr, shifted if sign > 0 else map(abs, shifted)))
+    
     def encrypt(self, message: str) -> bytes:
         assert message, "non-empty message required"
-        data = [list(map(ord, message)), list(map(ord, self.key))]
-        [data.__setitem__(1, [data[1][0:len(data[0])], data[1] + data[1][::-1]][len(data[1])<len(data[0])]) for x in enumerate(data[0])]
-        return "".join(map(chr, [data[0][x] + data[1][x] * 27 for x, _ in enumerate(data[0])])).encode()
+        return self._shift(message, 1).encode()
 
     def decrypt(self, message: str) -> str:
         assert message, "non-empty message required"
-        data = [list(map(ord, base64.b64decode(message).decode())), list(map(ord, self.key))]
-        [data.__setitem__(1, [data[1][0:len(data[0])], data[1]+data[1][::-1]][len(data[1])<len(data[0])]) for x in enumerate(data[0])]
-        return "".join(map(chr, [abs(data[0][x] - 27 * data[1][x]) for x, _ in enumerate(data[0])]))
+        return self._shift(base64.b64decode(message).decode(), -1)
+    
+    def _shift_bytes(self, data: bytes, sign: int) -> bytes:
+        if np is not None and len(data) >= 64:
+            stream = np.resize(np.frombuffer(self._period_bytes, dtype=np.uint8), len(data))
+            data = np.frombuffer(data, dtype=np.uint8)
+            return (data + stream if sign > 0 else data - stream).tobytes() # uint8 wraps around by itself
+        shifted = map(operator.add if sign > 0 else operator.sub, data, itertools.cycle(self._period_bytes))
+        return bytes(map(operator.and_, shifted, itertools.repeat(0xFF)))
+    
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """Compact variant for BLOB storage: one output byte per input byte."""
+        return self._shift_bytes(data, 1)
+    
+    def decrypt_bytes(self, data: bytes) -> bytes:
+        return self._shift_bytes(data, -1)
+
+def _encode_value(data: t.Any, codec: str, abc: t.Optional[Abc], storage: str) -> t.Any:
+    if codec == "secure":
+        if storage == "blob":
+            return abc.encrypt_bytes(str(data).encode()) # type: ignore
+        return base64.b64encode(abc.encrypt(str(data))).decode('ascii') # type: ignore
+    elif codec == "b64":
+        if storage == "blob":
+            return str(data).encode()
+        return base64.b64encode(str(data).encode()).decode("ascii")
+    elif codec == "compressed": # always a blob, base64 text would undo the saving
+        return zlib.compress(str(data).encode())
+    return data
+
+def _decode_value(data: t.Any, codec: str, abc: t.Optional[Abc]) -> t.Any:
+    # values are dispatched on their stored type, so text and blob rows can be read side by side
+    if codec == "secure":
+        if isinstance(data, bytes):
+            return abc.decrypt_bytes(data).decode() # type: ignore
+        return abc.decrypt(data) # type: ignore
+    elif codec == "b64":
+        if isinstance(data, bytes):
+            return data.decode()
+        return base64.b64decode(data.encode()).decode()
+    elif codec == "compressed" and isinstance(data, bytes):
+        return zlib.decompress(data).decode()
+    return data
+
+def _blind_key(abc: Abc) -> bytes:
+    return sha256(b"SSqlite blind index" + abc.key.encode()).digest() # never the cipher key itself
+
+def _blind_value(key: bytes, column: str, value: t.Any) -> bytes:
+    # keyed per column, so equal values in different columns don't share a hash
+    return hmac.new(key, f"{column}\0{value}".encode(), sha256).digest()[:16]
+
+xEncodeSpecT = t.Tuple[t.Tuple[str, ...], t.Tuple[str, ...], str] # codecs, blind-indexed columns, storage
+xDecodeSpecT = t.Tuple[t.Tuple[str, ...], t.Tuple[t.Optional[str], ...], t.Tuple[str, ...]] # names, decltypes, codecs
+
+def _build_decoder(spec: xDecodeSpecT, abc: t.Optional[Abc]) -> t.Callable[[t.Sequence[t.Any]], t.Dict[str, t.Any]]:
+    names, decltypes, codecs = spec
+    return _compile_decoder(names, decltypes, [None if x == "plain" else functools.partial(_decode_value, codec=x, abc=abc) for x in codecs])
+
+def _typecode(decltype: t.Optional[str], values: t.Sequence[t.Any]) -> t.Optional[str]:
+    if decltype is None: # raw query, guess from the first batch
+        decltype = "INT" if all([type(x) is int for x in values]) else "REAL" if all([type(x) is float for x in values]) else "TEXT"
+    return "q" if decltype in INTEGERS else "d" if decltype in REAL else None
+
+def _read_columns(
+    cur: sqlite3.Cursor, 
+    spec: xDecodeSpecT, 
+    abc: t.Optional[Abc], 
+    batchsize: int = 10_000
+) -> t.Dict[str, t.Union[array.array, t.List[t.Any]]]:
+    """Transposes cursor batches straight into one array per numeric column (a list once NULLs show up)."""
+    names, decltypes, codecs = spec
+    convert = []
+    for decltype, codec in zip(decltypes, codecs):
+        cast = _cast(decltype)
+        decode = None if codec == "plain" else functools.partial(_decode_value, codec=codec, abc=abc)
+        if decode is not None and cast is not None:
+            convert.append(lambda v, decode=decode, cast=cast: cast(decode(v)))
+        else: # plain numeric values already come out of sqlite as int/float
+            convert.append(decode or (cast if decltype not in INTEGERS + REAL else None))
+    columns: t.List[t.Any] = [None] * len(names)
+    while chunk := cur.fetchmany(batchsize):
+        for x, values in enumerate(zip(*chunk)):
+            if convert[x] is not None:
+                values = [None if v is None else convert[x](v) for v in values]
+            if columns[x] is None:
+                code = _typecode(decltypes[x], values)
+                columns[x] = array.array(code) if code else []
+            if isinstance(columns[x], array.array):
+                try:
+                    values = array.array(columns[x].typecode, values)
+                except (TypeError, OverflowError): # NULL or a stray non-numeric value
+                    columns[x] = columns[x].tolist()
+            columns[x].extend(values)
+    return {x: [] if y is None else y for x, y in zip(names, columns)}
+
+def _to_numpy(values: t.Union[array.array, t.List[t.Any]], decltype: t.Optional[str]) -> t.Any:
+    if isinstance(values, array.array):
+        return np.frombuffer(values, dtype=np.int64 if values.typecode == "q" else np.float64) # shares the buffer
+    if decltype in INTEGERS + REAL and all([x is None or isinstance(x, (int, float)) for x in values]):
+        return np.array([np.nan if x is None else x for x in values], dtype=np.float64)
+    return np.array(values, dtype=object)
+
+_worker: t.Dict[str, t.Any] = {} # per codec-worker process: cipher and compiled decoders
+
+def _init_worker(key: t.Optional[str]) -> None:
+    _worker["abc"] = Abc.from_key(key) if key else None
+    _worker["blind_key"] = _blind_key(_worker["abc"]) if key else None
+    _worker["decoders"] = {}
+
+def _encode_chunk(spec: xEncodeSpecT, rows: t.List[t.Dict[str, t.Any]]) -> t.List[t.Tuple[t.Any, ...]]:
+    codecs, blind, storage = spec
+    encoders = [_identity if x == "plain" else functools.partial(_encode_value, codec=x, abc=_worker["abc"], storage=storage) for x in codecs]
+    return [tuple([f(y) for f, y in zip(encoders, x.values())] + [_blind_value(_worker["blind_key"], z, x[z]) for z in blind]) for x in rows]
+
+def _decode_chunk(spec: xDecodeSpecT, rows: t.List[t.Tuple[t.Any, ...]]) -> t.List[t.Dict[str, t.Any]]:
+    decoder = _worker["decoders"].get(spec)
+    if decoder is None:
+        decoder = _worker["decoders"][spec] = _build_decoder(spec, _worker["abc"])
+    return [decoder(x) for x in rows]
 
 class FetchMode(IntEnum):
     FETCH_ONE = 1
     FETCH_ALL = 2
+    FETCH_ITER = 3
 
 class DataBaseException(Exception):
     ...
 
-class Table:
-    def __init__(self, name: str, db: "SqliteDatabase", *, created: t.Optional[bool] = None) -> None:
-        with db.create_connection() as con:
-            self.db = db
-            cur = con.cursor()
-            self.created = created
-            self.name = name
-            self._table_info = cur.execute(f"PRAGMA table_info({self.name});").fetchall()
-            self._rows = cur.execute(f"SELECT * FROM {self.name}").fetchall()
+class RowError(t.NamedTuple):
+    row: int # index of the offending dict in the input
+    column: str
+    value: t.Any
+    message: str
+
+class LRUCache:
+    """Thread-safe LRU mapping that counts its hits and misses."""
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "collections.OrderedDict[t.Hashable, t.Any]" = collections.OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get(self, key: t.Hashable, build: t.Callable[[], t.Any]) -> t.Any:
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+        value = build()
+        with self._lock:
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+    
+    def info(self) -> t.Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._data), "maxsize": self.maxsize}
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+def _sizeof(value: t.Any) -> int:
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum([sys.getsizeof(x) for x in value.values()])
+    elif isinstance(value, list):
+        return sys.getsizeof(value) + sum([_sizeof(x) for x in value])
+    return sys.getsizeof(value)
+
+class ResultCache:
+    """LRU cache of decoded fetch results bounded by an estimated byte budget, with optional TTL.
+
+    Every table has a generation bumped on invalidation; a result read before
+    a concurrent write is dropped instead of being cached after it.
+    """
+    def __init__(self, max_bytes: int, ttl: t.Optional[float] = None) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self._data: "collections.OrderedDict[t.Hashable, t.Tuple[t.Optional[float], int, str, t.Any]]" = collections.OrderedDict()
+        self._tables: t.Dict[str, t.Set[t.Hashable]] = collections.defaultdict(set)
+        self._generations: t.Dict[str, int] = collections.defaultdict(int)
+        self._generation = 0 # bumped when everything is invalidated
+        self._lock = threading.Lock()
+    
+    def _drop(self, key: t.Hashable) -> None: # caller holds self._lock
+        _, size, table, _ = self._data.pop(key)
+        self._tables[table].discard(key)
+        self.bytes -= size
+    
+    def get(self, key: t.Hashable) -> t.Tuple[bool, t.Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] is not None and entry[0] < time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            self._data.move_to_end(key)
+            value = entry[3]
+        return True, [dict(x) for x in value] if isinstance(value, list) else dict(value) # callers may mutate
+    
+    def generation(self, table: str) -> t.Tuple[int, int]:
+        return self._generation, self._generations[table]
+    
+    def put(self, key: t.Hashable, table: str, value: t.Any, generation: t.Tuple[int, int]) -> None:
+        size = _sizeof(value)
+        if size > self.max_bytes:
+            return
+        value = [dict(x) for x in value] if isinstance(value, list) else dict(value)
+        with self._lock:
+            if generation != (self._generation, self._generations[table]): # a write raced this read
+                return
+            if key in self._data:
+                self._drop(key)
+            self._data[key] = (time.monotonic() + self.ttl if self.ttl is not None else None, size, table, value)
+            self._tables[table].add(key)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._drop(next(iter(self._data)))
+                self.evictions += 1
+    
+    def invalidate(self, table: t.Optional[str] = None) -> None:
+        with self._lock:
+            if table is None:
+                self._data.clear()
+                self._tables.clear()
+                self.bytes = 0
+                self._generation += 1
+                return
+            self._generations[table] += 1
+            for key in self._tables.pop(table, ()):
+                self.bytes -= self._data.pop(key)[1]
+    
+    def info(self) -> t.Dict[str, t.Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits, "misses": self.misses, "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions, "entries": len(self._data), "bytes": self.bytes, "max_bytes": self.max_bytes
+        }
+
+class ConnectionPool:
+    """Pool of sqlite3 connections shared by every SqliteDatabase method.
+
+    A thread that already holds a connection gets the same one back, so nested
+    calls (e.g. ``fetch`` building a ``Table``) never check out a second handle.
+    The outermost release commits (or rolls back on error) like ``with con:``.
+    With ``per_thread`` every thread keeps one dedicated connection for its lifetime
+    instead of borrowing from the shared idle list.
+    ``reader`` hands out a separate, non-reentrant handle for lazy reads that suspend between rows;
+    readers are not bounded by ``max_size``, since their thread may already hold a pooled handle.
+    """
+    def __init__(
+        self, 
+        factory: t.Callable[[], sqlite3.Connection], 
+        max_size: int = 5, 
+        idle_timeout: t.Optional[float] = 60.0,
+        per_thread: bool = False
+    ) -> None:
+        assert max_size > 0, "Pool size must be positive."
+        self.factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.per_thread = per_thread
+        self._idle: t.Deque[t.Tuple[sqlite3.Connection, float]] = collections.deque()
+        self._owned: t.List[t.Tuple[threading.Thread, sqlite3.Connection]] = []
+        self._size = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._local = threading.local()
+        self.on_release: t.Optional[t.Callable[[], None]] = None # runs after the outermost commit/rollback
     
     def __repr__(self) -> str:
-        return f"<Table name={self.name}, rows={len(self._rows)}>" 
+        return f"<ConnectionPool size={self._size}, idle={len(self._idle)}, max_size={self.max_size}>"
+    
+    def _evict(self) -> None: # caller holds self._cond
+        if self.idle_timeout is None:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][1] < deadline:
+            self._idle.popleft()[0].close()
+            self._size -= 1
+    
+    def _own(self) -> sqlite3.Connection:
+        con = getattr(self._local, "own", None)
+        if con is not None:
+            return con
+        with self._cond:
+            if self._closed:
+                raise DataBaseException("Connection pool is closed.")
+            for x in [x for x in self._owned if not x[0].is_alive()]: # reclaim handles of finished threads
+                x[1].close()
+                self._owned.remove(x)
+            con = self._local.own = self.factory()
+            self._owned.append((threading.current_thread(), con))
+        return con
+    
+    def _checkout(self, timeout: t.Optional[float], shared: bool = False, bounded: bool = True) -> sqlite3.Connection:
+        if self.per_thread and not shared:
+            return self._own()
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise DataBaseException("Connection pool is closed.")
+                self._evict()
+                if self._idle:
+                    return self._idle.pop()[0] # most recently used one has the warmest page cache
+                if self._size < self.max_size or not bounded:
+                    self._size += 1
+                    break
+                if not self._cond.wait(timeout):
+                    raise DataBaseException(f"No free connection in pool after {timeout}s.")
+        try:
+            return self.factory()
+        except BaseException:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+    
+    def acquire(self, timeout: t.Optional[float] = None) -> sqlite3.Connection:
+        held = getattr(self._local, "held", None)
+        if held is not None:
+            self._local.depth += 1
+            return held
+        con = self._checkout(timeout)
+        self._local.held, self._local.depth = con, 1
+        return con
+    
+    def release(self, con: sqlite3.Connection, failed: bool = False) -> None:
+        self._local.depth -= 1
+        if self._local.depth:
+            return
+        self._local.held = None
+        healthy = True
+        try:
+            try:
+                con.rollback() if failed else con.commit()
+            except BaseException: # e.g. a locked commit: never hand out a handle with the transaction still open
+                try:
+                    con.rollback()
+                except BaseException:
+                    healthy = False
+                raise
+        finally:
+            if self.on_release is not None:
+                self.on_release()
+            if not healthy:
+                self._discard(con)
+            elif not self.per_thread: # otherwise it stays with its thread, close() takes care of it
+                self._giveback(con)
+    
+    def _discard(self, con: sqlite3.Connection) -> None:
+        con.close()
+        with self._cond:
+            if getattr(self._local, "own", None) is con:
+                self._local.own = None
+                self._owned = [x for x in self._owned if x[1] is not con]
+            else:
+                self._size -= 1
+            self._cond.notify()
+    
+    def _giveback(self, con: sqlite3.Connection) -> None:
+        with self._cond:
+            if self._closed or self._size > self.max_size: # a reader's overflow handle is not kept
+                con.close()
+                self._size -= 1
+            else:
+                self._idle.append((con, time.monotonic()))
+            self._cond.notify()
     
     @property
-    def exists(self) -> bool:
-        with self.db.create_connection() as con:
-            cur = con.cursor()
+    def held(self) -> t.Optional[sqlite3.Connection]:
+        """The connection the calling thread has checked out (e.g. inside ``transaction()``), if any."""
+        return getattr(self._local, "held", None)
+    
+    @property
+    def holding(self) -> bool:
+        return self.held is not None
+    
+    @contextlib.contextmanager
+    def connection(self, timeout: t.Optional[float] = None) -> t.Iterator[sqlite3.Connection]:
+        con = self.acquire(timeout)
+        try:
+            yield con
+        except BaseException:
+            self.release(con, failed=True)
+            raise
+        self.release(con)
+    
+    @contextlib.contextmanager
+    def reader(self, timeout: t.Optional[float] = None) -> t.Iterator[sqlite3.Connection]:
+        """Checkout that is never the thread's held connection, so writes made while it is
+        suspended neither nest in it nor get rolled back when it closes; it may end on any thread."""
+        # per_thread pools lend these from the idle list too; never waits, as the thread may hold the last handle
+        con = self._checkout(timeout, shared=True, bounded=False)
+        try:
+            yield con
+        finally: # reads only, nothing to commit or roll back
+            self._giveback(con)
+    
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                self._idle.pop()[0].close()
+                self._size -= 1
+            while self._owned:
+                self._owned.pop()[1].close()
+            self._cond.notify_all()
+
+class Table:
+    def __init__(
+        self, 
+        name: str, 
+        db: "SqliteDatabase", 
+        *, 
+        created: t.Optional[bool] = None, 
+        arraysize: int = 1000
+    ) -> None:
+        self.db = db
+        self.created = created
+        self.name = name
+        self.arraysize = arraysize # rows pulled from the cursor per fetchmany
+    
+    def __repr__(self) -> str:
+        return f"<Table name={self.name}, rows={len(self)}>" 
+    
+    def __len__(self) -> int:
+        with self.db.connection() as con:
             try:
-                return cur.execute(f"SELECT * FROM {self.name};") is not None
+                return con.execute(f"SELECT COUNT(*) FROM {self.name};").fetchone()[0]
             except sqlite3.OperationalError:
-                return False
+                return 0
+    
+    def __iter__(self) -> t.Iterator[sqlite3.Row]:
+        with self.db.reader() as con: # writes made while iterating must not nest in this checkout
+            cur = con.cursor()
+            cur.arraysize = self.arraysize
+            try:
+                cur.execute(f"SELECT * FROM {self.name};")
+                while chunk := cur.fetchmany():
+                    yield from chunk
+            finally:
+                cur.close()
+    
+    @property
+    def _table_info(self) -> t.List[t.Tuple[int, str, str]]:
+        return [(x, y, z) for x, (y, z) in enumerate(self.db.schema(self.name).items())]
+    
+    @property
+    def exists(self) -> bool:
+        return not not self.db.schema(self.name)
     
     @property
     def rows(self) -> t.Optional[t.Dict[t.Any, t.Any]]:
         if not self.exists:
             return None
         tcolumns = [x[1] for x in self._table_info]
-        data = {x: {tcolumns[z]: y[z] for z, _ in enumerate(tcolumns)} for x, y in enumerate(self._rows, start=1)}
-        data["_types"] = {tcolumns[x]: y if y else "BLOB" for x, y in enumerate([x[2] for x in self._table_info])} # type: ignore
+        data = {x: dict(zip(tcolumns, y)) for x, y in enumerate(self, start=1)}
+        data["_types"] = {x[1]: x[2] for x in self._table_info} # type: ignore
         return data
 
+    @property
+    def codecs(self) -> t.Dict[str, str]:
+        return self.db.codecs(self.name)
+
     @property
     def columns(self) -> t.Optional[t.Dict[t.Any, t.Any]]:
         if not self.exists:
             return None
-        return {int(x[0]) + 1: {x[1]: x[2] if x[2] else "BLOB"} for x in self._table_info}
+        return {x[0] + 1: {x[1]: x[2]} for x in self._table_info}
     
     @property
     def pretty_print(self) -> t.Optional[str]:
         if not self.exists:
             return None
-        columns = "0. | " + " | ".join([x[1] + f": {x[2] if x[2] else 'BLOB'}" for x in self._table_info]) + " |\n"
-        for x, row in enumerate(self._rows):
-            columns += f"{x + 1}. | " + f"{' | '.join([str(x) for x in row])}" + " |\n"
-        return f"table {self.name}:\n" + "=" * 50 + "\n" + columns + "=" * 50
+        lines = ["0. | " + " | ".join([f"{x[1]}: {x[2]}" for x in self._table_info]) + " |"]
+        lines.extend(f"{x}. | " + " | ".join([str(y) for y in row]) + " |" for x, row in enumerate(self, start=1))
+        return f"table {self.name}:\n" + "=" * 50 + "\n" + "\n".join(lines) + "\n" + "=" * 50
     
     def drop(self) -> bool:
-        with self.db.create_connection() as con:
+        with self.db.connection() as con:
             cur = con.cursor()
             try:
                 cur.execute(f"DROP TABLE {self.name};")
             except sqlite3.OperationalError:
                 return False
+            with contextlib.suppress(sqlite3.OperationalError): # no table ever declared codecs
+                cur.execute(f"DELETE FROM {CODEC_TABLE} WHERE tbl = ?;", (self.name,))
+            self.db._touch(self.name)
+            return True
+    
+    @property
+    def indexes(self) -> t.List[t.Dict[str, t.Any]]:
+        with self.db.connection() as con:
+            return [
+                {"name": x[1], "columns": [y[2] for y in con.execute(f"PRAGMA index_info({x[1]});")], "unique": not not x[2], "partial": not not x[4]}
+                for x in con.execute(f"PRAGMA index_list({self.name});").fetchall()
+            ]
+    
+    def create_index(
+        self, 
+        columns: t.Union[str, t.Sequence[str]], 
+        unique: bool = False, 
+        where: t.Optional[str] = None, 
+        name: t.Optional[str] = None
+    ) -> str:
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        name = name if name else f"ix_{self.name}_{'_'.join(columns)}"
+        with self.db.connection() as con:
+            con.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {self.name} ({', '.join(columns)}){' WHERE ' + where if where else ''};")
+        return name
+    
+    def drop_index(self, name: str) -> bool:
+        with self.db.connection() as con:
+            try:
+                con.execute(f"DROP INDEX {name};")
+            except sqlite3.OperationalError:
+                return False
             return True
 
 class DataBaseResponse:
@@ -105,11 +732,13 @@ class DataBaseResponse:
         value: t.Optional[xResponseValueT] = None, 
         query: t.Optional[str] = None, 
         cursor: t.Optional[sqlite3.Cursor] = None,
+        errors: t.Optional[t.List["RowError"]] = None,
     ) -> None:
         self.__status = status
         self.__value = value
         self.__query = query
         self.__cursor = cursor
+        self.__errors = errors if errors else []
     
     def __repr__(self) -> str:
         return f'<DataBaseResponse status={self.status}, value={self.value}, cursor={self.cursor} at {hex(id(self))}>'
@@ -132,98 +761,588 @@ class DataBaseResponse:
     @property
     def query(self) -> t.Optional[str]:
         return self.__query
+    
+    @property
+    def errors(self) -> t.List["RowError"]:
+        return self.__errors
+
+class IndexAdvisor:
+    """Counts the criteria shapes used by fetch/remove/update and suggests indexes for the ones SQLite scans."""
+    SEEKABLE = ("eq", "in", "is_null")
+    RANGES = ("lt", "lte", "gt", "gte")
+    
+    def __init__(self) -> None:
+        self.usage: t.Counter[t.Tuple[str, t.Tuple[t.Tuple[str, str], ...]]] = collections.Counter()
+        self._lock = threading.Lock()
+    
+    def record(self, table: str, shape: t.Sequence[t.Tuple[str, str, int]]) -> None:
+        if shape:
+            with self._lock:
+                self.usage[(table, tuple([(x[0], x[1]) for x in shape]))] += 1
+    
+    def suggest(self, db: "SqliteDatabase", min_uses: int = 1) -> t.List[t.Dict[str, t.Any]]:
+        with self._lock:
+            usage = self.usage.most_common()
+        suggestions: t.Dict[t.Tuple[str, t.Tuple[str, ...]], t.Dict[str, t.Any]] = {}
+        with db.connection() as con:
+            for (table, shape), uses in usage:
+                if uses < min_uses:
+                    continue
+                # equality-like columns first, then at most one range column: the prefix a B-tree can seek on
+                columns = [x for x, y in shape if y in self.SEEKABLE] + [x for x, y in shape if y in self.RANGES][:1]
+                if not columns:
+                    continue
+                probe = _where_sql([(x, y, 1) for x, y in shape])
+                plan = [x[3] for x in con.execute(f"EXPLAIN QUERY PLAN SELECT * FROM {table} WHERE {probe};", [None] * probe.count("?"))]
+                if not any(re.match(rf"SCAN (TABLE )?{re.escape(table)}\b", x) for x in plan): # "SCAN TABLE t" before SQLite 3.36
+                    continue
+                entry = suggestions.setdefault((table, tuple(dict.fromkeys(columns))), {"table": table, "columns": list(dict.fromkeys(columns)), "uses": 0, "plan": plan})
+                entry["uses"] += uses
+        return sorted(suggestions.values(), key=lambda x: -x["uses"])
+    
+    def reset(self) -> None:
+        with self._lock:
+            self.usage.clear()
+
+class WriteBehindQueue:
+    """Single writer thread group-committing queued ``add`` calls.
+
+    A batch is committed once it holds ``max_rows`` rows or ``interval`` seconds
+    passed since its first write, whichever comes first.
+    """
+    def __init__(self, db: "SqliteDatabase", interval: float = 0.01, max_rows: int = 1000) -> None:
+        self.db = db
+        self.interval = interval
+        self.max_rows = max_rows
+        self._queue: "queue.Queue[t.Optional[t.Tuple[concurrent.futures.Future, xInputDataT, str, int]]]" = queue.Queue()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="SSqlite-writer", daemon=True)
+        self._thread.start()
+    
+    def submit(self, data: xInputDataT, table: str, chunksize: int = 10_000) -> "concurrent.futures.Future[DataBaseResponse]":
+        if self._closed:
+            raise DataBaseException("Write-behind queue is closed.")
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._queue.put((future, data, table, chunksize))
+        return future
+    
+    def _run(self) -> None:
+        while (item := self._queue.get()) is not None:
+            batch, rows = [item], 1 if isinstance(item[1], dict) else len(item[1])
+            deadline = time.monotonic() + self.interval
+            while rows < self.max_rows:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is None:
+                    break
+                batch.append(item)
+                rows += 1 if isinstance(item[1], dict) else len(item[1])
+            self._commit(batch)
+            [self._queue.task_done() for _ in batch]
+            if item is None:
+                break
+        self._queue.task_done()
+    
+    def _commit(self, batch: t.List[t.Tuple[concurrent.futures.Future, xInputDataT, str, int]]) -> None:
+        batch = [x for x in batch if x[0].set_running_or_notify_cancel()]
+        try:
+            with self.db.transaction("IMMEDIATE"): # one commit (and fsync) for the whole batch
+                results = [self.db._insert(data, table, chunksize) for _, data, table, chunksize in batch]
+        except Exception:
+            for future, data, table, chunksize in batch: # one failing write must not fail its neighbours
+                try:
+                    future.set_result(self.db._insert(data, table, chunksize))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        for (future, *_), result in zip(batch, results):
+            future.set_result(result)
+    
+    def flush(self) -> None:
+        self._queue.join()
+    
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
 
 class SqliteDatabase:
     def __init__(
         self, 
         dbpath: t.Optional[str] = None,
         datamode: t.Literal["b64", "secure", "default"] = "default",  
-        encpwd: t.Optional[str] = None
+        encpwd: t.Optional[str] = None,
+        *,
+        pool_size: int = 5,
+        pool_timeout: t.Optional[float] = 60.0,
+        storage: t.Literal["text", "blob"] = "text",
+        threadsafe: bool = False,
+        write_behind: bool = False,
+        flush_interval: float = 0.01,
+        flush_rows: int = 1000,
+        profile: t.Optional[t.Union[str, t.Dict[str, t.Union[str, int]]]] = None,
+        statement_cache_size: int = 256,
+        result_cache_bytes: int = 0,
+        result_cache_ttl: t.Optional[float] = None,
+        index_advisor: bool = False,
+        decode_workers: int = 0,
+        decode_threshold: int = 20_000,
+        encode_workers: int = 0,
+        encode_threshold: int = 20_000
     ) -> None:
         self.datamode = datamode.lower()
         assert self.datamode in ["b64", "secure", "default"], "Mode must be either b64 or secure or default."
+        self.storage = storage.lower()
+        assert self.storage in ["text", "blob"], "Storage must be either text or blob."
+        self.codec = "plain" if self.datamode == "default" else self.datamode # for columns without a declared codec
         if self.datamode == "secure":
             assert encpwd, "Secure mode requires a data-encryption password."
-            self.abc = Abc(encpwd)
-        if encpwd:
-            assert self.datamode == "secure"
+        self.abc = Abc(encpwd) if encpwd else None # also keys secure columns of an otherwise plain database
+        if self.abc is not None:
+            self._blind_key = _blind_key(self.abc)
         self.dbpath = dbpath if dbpath else "sqlite.db"
+        self.threadsafe = threadsafe
+        assert profile is None or isinstance(profile, dict) or profile in PROFILES, f"Profile must be one of {', '.join(PROFILES)} or a dict of PRAGMAs."
+        self.pragmas = dict(PROFILES[profile] if isinstance(profile, str) else profile or {})
+        if threadsafe and "query_only" not in self.pragmas: # readers and the writer stop blocking each other
+            self.pragmas.setdefault("journal_mode", "WAL")
+        self.pool = ConnectionPool(
+            self._pooled_connection, 
+            max_size=pool_size, 
+            idle_timeout=pool_timeout,
+            per_thread=threadsafe
+        )
+        self._schema_cache: t.Dict[str, t.Tuple[int, t.Dict[str, str]]] = {}
+        self._validators: t.Dict[t.Tuple[str, int], t.Callable[[t.Iterable[t.Dict[str, t.Any]]], t.List[RowError]]] = {}
+        self._decoders: t.Dict[t.Tuple[str, int, t.Tuple[str, ...]], t.Callable[[t.Sequence[t.Any]], t.Dict[str, t.Any]]] = {}
+        self._codecs: t.Dict[t.Tuple[str, int], t.Dict[str, str]] = {}
+        self._schema_version: t.Optional[int] = None
+        self.statement_cache_size = statement_cache_size
+        self._statements = LRUCache(statement_cache_size) # generated SQL by operation shape
+        self.results = ResultCache(result_cache_bytes, result_cache_ttl) if result_cache_bytes else None
+        self._dirty = threading.local() # tables written by this thread's pending transaction
+        self.pool.on_release = self._released
+        self.advisor = IndexAdvisor() if index_advisor else None
+        self.writer = WriteBehindQueue(self, flush_interval, flush_rows) if write_behind else None
+        self.decode_workers = decode_workers # processes decoding FETCH_ALL results of at least decode_threshold rows
+        self.decode_threshold = decode_threshold
+        self.encode_workers = encode_workers # processes encoding add/upsert batches of at least encode_threshold rows
+        self.encode_threshold = encode_threshold
+        self._workers: t.Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self._workers_lock = threading.Lock()
+    
+    def __enter__(self) -> "SqliteDatabase":
+        return self
+    
+    def __exit__(self, *_) -> None:
+        self.close()
 
     def create_connection(self, **kwargs) -> sqlite3.Connection:
         conn = sqlite3.connect(self.dbpath, **kwargs)
         conn.row_factory = sqlite3.Row
         return conn
     
+    def _pooled_connection(self) -> sqlite3.Connection:
+        # pooled handles only ever serve one thread at a time, the pool enforces that instead of sqlite3,
+        # and close() may run from another thread than the one that opened the handle
+        # sqlite3 reuses prepared statements per connection by SQL text, sized to the generated SQL cache
+        conn = self.create_connection(check_same_thread=False, cached_statements=self.statement_cache_size)
+        for x, y in self.pragmas.items():
+            conn.execute(f"PRAGMA {x}={y};")
+        return conn
+    
+    def connection(self) -> t.ContextManager[sqlite3.Connection]:
+        return self.pool.connection()
+    
+    def reader(self) -> t.ContextManager[sqlite3.Connection]:
+        return self.pool.reader()
+    
+    def _touch(self, table: t.Optional[str] = None) -> None:
+        """Invalidates cached results of ``table`` (all tables if None) now and again once the write commits."""
+        if self.results is None:
+            return
+        self.results.invalidate(table)
+        if not hasattr(self._dirty, "tables"):
+            self._dirty.tables = set()
+        self._dirty.tables.add(table)
+    
+    def _uncommitted(self) -> bool:
+        """Whether this thread would read its own pending writes, which no other thread may see from the cache."""
+        held = self.pool.held
+        return (held is not None and held.in_transaction) or not not getattr(self._dirty, "tables", None)
+    
+    def _released(self) -> None:
+        # readers in other threads could cache pre-commit state between the write and its commit
+        if tables := getattr(self._dirty, "tables", None):
+            self._dirty.tables = set()
+            [self.results.invalidate(x) for x in tables] # type: ignore
+    
+    def suggest_indexes(self, min_uses: int = 1) -> t.List[t.Dict[str, t.Any]]:
+        if self.advisor is None:
+            raise DataBaseException("Index advisor is disabled, pass index_advisor=True.")
+        return self.advisor.suggest(self, min_uses)
+    
+    def result_cache_info(self) -> t.Optional[t.Dict[str, t.Any]]:
+        return self.results.info() if self.results is not None else None
+    
+    def statement_cache_info(self) -> t.Dict[str, int]:
+        return self._statements.info()
+    
+    def flush(self) -> None:
+        if self.writer is not None:
+            self.writer.flush()
+    
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+        if self._workers is not None:
+            self._workers.shutdown()
+        self.pool.close()
+    
+    @contextlib.contextmanager
+    def transaction(
+        self, 
+        mode: t.Literal["DEFERRED", "IMMEDIATE", "EXCLUSIVE"] = "DEFERRED"
+    ) -> t.Iterator[sqlite3.Connection]:
+        """Pins one connection for the block: every method called inside reuses it and commits once at exit."""
+        mode = mode.upper() # type: ignore
+        assert mode in ["DEFERRED", "IMMEDIATE", "EXCLUSIVE"], "Mode must be either DEFERRED or IMMEDIATE or EXCLUSIVE."
+        with self.connection() as con:
+            if con.in_transaction: # nested, join the outer transaction
+                yield con
+                return
+            con.execute(f"BEGIN {mode};")
+            try:
+                yield con
+            except BaseException:
+                con.rollback()
+                raise
+            con.commit()
+    
+    def _schema_entry(self, con: sqlite3.Connection, table: str) -> t.Tuple[int, t.Dict[str, str]]:
+        version = con.execute("PRAGMA schema_version;").fetchone()[0] # header read, no table data touched
+        if version != self._schema_version:
+            self._schema_cache.clear()
+            self._decoders.clear()
+            self._validators.clear()
+            self._codecs.clear()
+            if self.results is not None and self._schema_version is not None:
+                self.results.invalidate()
+            self._schema_version = version
+        entry = self._schema_cache.get(table)
+        if entry is None or entry[0] != version: # entries carry their version, a racing thread can't serve a stale one
+            info = con.execute(f"PRAGMA table_info({table});").fetchall()
+            entry = self._schema_cache[table] = (version, {x[1]: x[2] if x[2] else "BLOB" for x in info})
+        return entry
+    
+    def _schema(self, con: sqlite3.Connection, table: str) -> t.Dict[str, str]:
+        return self._schema_entry(con, table)[1]
+    
+    def _codec_map(self, con: sqlite3.Connection, table: str) -> t.Dict[str, str]:
+        version, columns = self._schema_entry(con, table) # codecs only change with CREATE/DROP TABLE
+        codecs = self._codecs.get((table, version))
+        if codecs is None:
+            try:
+                declared = dict(con.execute(f"SELECT col, codec FROM {CODEC_TABLE} WHERE tbl = ?;", (table,)).fetchall())
+            except sqlite3.OperationalError: # no table declared codecs yet
+                declared = {}
+            codecs = self._codecs[(table, version)] = {x: declared.get(x, "plain" if x.endswith(BLIND_SUFFIX) else self.codec) for x in columns}
+        return codecs
+    
+    def codecs(self, table: str) -> t.Dict[str, str]:
+        with self.connection() as con:
+            return dict(self._codec_map(con, table))
+    
+    def _encoder(self, codec: str) -> t.Callable[[t.Any], t.Any]:
+        return _identity if codec == "plain" else functools.partial(self._encode, codec=codec)
+    
+    def _encoders(self, con: sqlite3.Connection, table: str, columns: t.Iterable[str]) -> t.List[t.Callable[[t.Any], t.Any]]:
+        codecs = self._codec_map(con, table)
+        return [self._encoder(codecs.get(x, self.codec)) for x in columns]
+    
+    def _blinds(self, con: sqlite3.Connection, table: str) -> t.Set[str]:
+        return {x[:-len(BLIND_SUFFIX)] for x in self._schema(con, table) if x.endswith(BLIND_SUFFIX)}
+    
+    def _blind(self, column: str, value: t.Any) -> bytes:
+        return _blind_value(self._blind_key, column, value)
+    
+    def blind_index(self, table: str, column: str, chunksize: int = 10_000) -> str:
+        """Adds an indexed keyed-hash shadow column so equality lookups on an encrypted column become index seeks."""
+        shadow = column + BLIND_SUFFIX
+        with self.transaction("IMMEDIATE") as con:
+            schema = self._schema(con, table)
+            if column not in schema:
+                raise DataBaseException(f"No such column: {column}")
+            if self._codec_map(con, table)[column] != "secure":
+                raise DataBaseException("Blind indexes are only needed (and keyed) on secure columns.")
+            if shadow not in schema:
+                con.execute(f"ALTER TABLE {table} ADD COLUMN {shadow} BLOB;")
+            select = f"SELECT rowid, {column} FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT {chunksize};"
+            cur, last = con.cursor(), -1
+            while chunk := cur.execute(select, (last,)).fetchall():
+                cur.executemany(f"UPDATE {table} SET {shadow} = ? WHERE rowid = ?;", [(None if x[1] is None else self._blind(column, self._decode(x[1], "secure")), x[0]) for x in chunk])
+                last = chunk[-1][0]
+            con.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_{shadow} ON {table} ({shadow});")
+            self._touch(table)
+        return shadow
+    
+    def schema(self, table: str) -> t.Dict[str, str]:
+        with self.connection() as con:
+            return dict(self._schema(con, table))
+    
+    def _decode_spec(self, con: sqlite3.Connection, table: str, names: t.Tuple[str, ...]) -> xDecodeSpecT:
+        columns, codecs = self._schema(con, table), self._codec_map(con, table)
+        return names, tuple([columns.get(x) for x in names]), tuple([codecs.get(x, self.codec) for x in names])
+    
+    def _decoder(
+        self, 
+        con: sqlite3.Connection, 
+        table: str, 
+        cur: sqlite3.Cursor
+    ) -> t.Callable[[t.Sequence[t.Any]], t.Dict[str, t.Any]]:
+        names = tuple([x[0] for x in cur.description])
+        version = self._schema_entry(con, table)[0] # also drops stale decoders on schema change
+        decoder = self._decoders.get((table, version, names))
+        if decoder is None:
+            decoder = self._decoders[(table, version, names)] = _build_decoder(self._decode_spec(con, table, names), self.abc)
+        return decoder
+    
+    def _decode_rows(
+        self, 
+        con: sqlite3.Connection, 
+        table: str, 
+        cur: sqlite3.Cursor, 
+        rows: t.List[t.Tuple[t.Any, ...]]
+    ) -> t.List[t.Dict[str, t.Any]]:
+        decoder = self._decoder(con, table, cur)
+        if not self.decode_workers or len(rows) < self.decode_threshold:
+            return [decoder(x) for x in rows]
+        spec = self._decode_spec(con, table, tuple([x[0] for x in cur.description]))
+        if all([x == "plain" for x in spec[2]]): # casts alone are cheaper than pickling rows to a worker
+            return [decoder(x) for x in rows]
+        size = -(-len(rows) // (self.decode_workers * 4)) # a few chunks per worker evens out uneven rows
+        chunks = [rows[x:x + size] for x in range(0, len(rows), size)]
+        return [y for x in self._worker_pool().map(_decode_chunk, itertools.repeat(spec, len(chunks)), chunks) for y in x]
+    
+    def _worker_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        with self._workers_lock:
+            if self._workers is None: # started on first use, workers then stay warm
+                self._workers = concurrent.futures.ProcessPoolExecutor(
+                    max(self.decode_workers, self.encode_workers), 
+                    initializer=_init_worker, 
+                    initargs=(self.abc.key if self.abc is not None else None,)
+                )
+            return self._workers
+    
+    def _encode_pipelined(
+        self, 
+        spec: xEncodeSpecT, 
+        chunks: t.Iterable[t.List[t.Dict[str, t.Any]]]
+    ) -> t.Iterator[t.List[t.Tuple[t.Any, ...]]]:
+        """Yields encoded chunks in order while the workers keep encoding the next ones."""
+        pool, pending = self._worker_pool(), collections.deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(_encode_chunk, spec, chunk))
+                if len(pending) >= 2 * self.encode_workers: # bounds encoded rows held in memory
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally: # a failed insert stops the remaining chunks
+            for x in pending:
+                x.cancel()
+    
     def to_datetime(self, obj: str | int | float) -> datetime.datetime:
-        if isinstance(obj, str): # probably isoformat
-            if obj.isnumeric(): # str'ed timestamp probably
-                return datetime.datetime.fromtimestamp(float(obj))
-            return datetime.datetime.fromisoformat(obj) # let error raise if smth goes wrong
-        elif isinstance(obj, (int, float)): # timestamp probably
-            return datetime.datetime.fromtimestamp(obj)
-        raise ValueError("Incorrect arg")
+        return _to_datetime(obj)
+    
+    def _validator(self, con: sqlite3.Connection, table: str) -> t.Callable[[t.Iterable[t.Dict[str, t.Any]]], t.List[RowError]]:
+        version, columns = self._schema_entry(con, table) # also drops stale validators on schema change
+        validator = self._validators.get((table, version))
+        if validator is None:
+            validator = self._validators[(table, version)] = _compile_validator(columns)
+        return validator
+    
+    def validate(self, data: xInputDataT, table: str) -> t.List[RowError]:
+        with self.connection() as con:
+            return self._validator(con, table)([data] if isinstance(data, dict) else data)
     
     def add_typecheck(self, data: xInputDataT, columns: t.Dict[str, t.Any]) -> bool:
-        data = list(data.values()) # type: ignore
-        columns = list(columns.values()) # type: ignore
-        try:
-            for x, y in enumerate(columns):
-                if y == "BLOB" or y not in ALL:
-                    continue
-                elif y in DATE:
-                    if isinstance(data[x], str):
-                        if not data[x].isnumeric(): # type: ignore
-                            datetime.datetime.fromisoformat(data[x]) # type: ignore
-                    else:
-                        datetime.datetime.fromtimestamp(float(data[x])) # type: ignore
-                else:
-                    assert isinstance(data[x], LOOKUP.get(y)), f"type mismatch for value {data[x]} which must be type of {LOOKUP.get(y)}" # type: ignore
-            return True
-        except (AssertionError, Exception):
-            __import__("traceback").print_exc()
-            return False
+        return not _compile_validator(columns)([data] if isinstance(data, dict) else data)
     
-    def _encode(self, data: str) -> str:
-        if self.datamode == "secure":
-            return base64.b64encode(self.abc.encrypt(str(data))).decode('ascii')
-        elif self.datamode == "b64":
-            return base64.b64encode(str(data).encode()).decode("ascii")
-        return data
+    def _encode(self, data: t.Any, codec: t.Optional[str] = None) -> t.Any:
+        return _encode_value(data, codec or self.codec, self.abc, self.storage)
     
-    def _decode(self, data: str) -> str:
-        if self.datamode == "secure":
-            return self.abc.decrypt(data)
-        elif self.datamode == "b64":
-            return base64.b64decode(data.encode()).decode("ascii")
-        return data
+    def _decode(self, data: t.Any, codec: t.Optional[str] = None) -> t.Any:
+        return _decode_value(data, codec or self.codec, self.abc)
+    
+    def _size(self) -> int:
+        with self.connection() as con:
+            return con.execute("PRAGMA page_count;").fetchone()[0] * con.execute("PRAGMA page_size;").fetchone()[0]
+    
+    def migrate_storage(self, table: str, vacuum: bool = True, chunksize: int = 10_000) -> DataBaseResponse:
+        """Rewrites every value of ``table`` into this database's ``storage`` format in place."""
+        size_before = self._size()
+        with self.connection() as con:
+            codecs = {x: y for x, y in self._codec_map(con, table).items() if y in ("b64", "secure")} # others don't depend on storage
+            if not codecs:
+                raise DataBaseException(f"{table} stores no b64 or secure columns, nothing to migrate.")
+            columns = list(codecs)
+            select = f"SELECT rowid, {', '.join(columns)} FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT {chunksize};"
+            update = f"UPDATE {table} SET {', '.join([f'{x}=?' for x in columns])} WHERE rowid=?;"
+            cur, rows, last = con.cursor(), 0, -1
+            while chunk := cur.execute(select, (last,)).fetchall(): # fully read before writing to the same table
+                cur.executemany(update, [tuple([None if y is None else self._encode(self._decode(y, z), z) for y, z in zip(x[1:], codecs.values())]) + (x[0],) for x in chunk])
+                rows, last = rows + len(chunk), chunk[-1][0]
+            self._touch(table)
+        if vacuum:
+            with self.connection() as con:
+                con.execute("VACUUM;")
+        return DataBaseResponse(status=not not rows, value={"rows": rows, "size_before": size_before, "size_after": self._size()})
 
     @property
     def tables(self) -> t.List[Table]:
-        with self.create_connection() as con:
+        with self.connection() as con:
             cur = con.cursor()
-            cur.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        return [Table(x[0], db=self) for x in cur.fetchall()]
+            names = [x[0] for x in cur.execute("SELECT name FROM sqlite_master WHERE type='table';").fetchall()] # before the handle goes back
+        return [Table(x, db=self) for x in names if x != CODEC_TABLE]
     
-    def table(self, name: str, *columns) -> "Table":
-        with self.create_connection() as con:
+    def table(self, name: str, *columns, codecs: t.Optional[t.Dict[str, str]] = None) -> "Table":
+        """``codecs`` maps columns to plain/b64/secure/compressed, the rest use the datamode; fixed at creation."""
+        names = [x.split()[0] for x in columns]
+        if codecs:
+            assert all([x in CODECS for x in codecs.values()]), f"Codec must be one of {', '.join(CODECS)}."
+            assert all([x in names for x in codecs]), "Codecs can only be declared for the table's columns."
+            if "secure" in codecs.values() and self.abc is None:
+                raise DataBaseException("Secure columns require a data-encryption password.")
+        with self.connection() as con:
             cur = con.cursor()
-            columns = f"({','.join(columns)})"
             try:
                 created = not cur.execute(f"SELECT * FROM {name};") is not None
             except sqlite3.OperationalError: # table is not exist
                 created = True
-            cur.execute(f"CREATE TABLE IF NOT EXISTS {name}{columns};")
+            cur.execute(f"CREATE TABLE IF NOT EXISTS {name}({','.join(columns)});")
+            if created and codecs: # every column is recorded, so the table reads the same under any datamode
+                cur.execute(f"CREATE TABLE IF NOT EXISTS {CODEC_TABLE}(tbl TEXT, col TEXT, codec TEXT, PRIMARY KEY (tbl, col));")
+                cur.executemany(f"INSERT INTO {CODEC_TABLE} VALUES (?, ?, ?);", [(name, x, codecs.get(x, self.codec)) for x in names])
+            elif codecs and any([self._codec_map(con, name).get(x) != y for x, y in codecs.items()]):
+                raise DataBaseException(f"{name} already exists with codecs {self._codec_map(con, name)}.")
+            self._touch(name)
         return Table(name, created=created, db=self)
     
     def drop_table(self, name: str) -> bool:
         return Table(name, self).drop()
     
-    def execute(self, query: str) -> DataBaseResponse:
-        with self.create_connection() as con:
+    def execute(self, query: str, format: t.Literal["rows", "columns", "numpy"] = "rows") -> DataBaseResponse:
+        assert format in ("rows", "columns", "numpy"), "Format must be either rows, columns or numpy."
+        with self.connection() as con:
             cur = con.cursor()
+            changes = con.total_changes
+            if format != "rows":
+                cur.row_factory = None
             cur.execute(query)
-            data = [dict(x) for x in cur.fetchall()]
-        return DataBaseResponse(status=not not data, value=data, cursor=cur, query=query)
+            if format != "rows" and cur.description is not None: # raw values, column types guessed from the data
+                names = tuple([x[0] for x in cur.description])
+                count, data = self._columns(cur, (names, (None,) * len(names), ("plain",) * len(names)), format) # type: ignore
+            else:
+                data = [dict(x) for x in cur.fetchall()]
+                count = len(data)
+            if cur.description is None or con.total_changes != changes: # raw write or DDL (maybe with RETURNING), tables unknown
+                self._touch()
+            cur.close() # the handle returns to the pool, the response keeps description/rowcount/lastrowid only
+        return DataBaseResponse(status=not not count, value=data, cursor=cur, query=query)
+    
+    def _where(
+        self, 
+        con: sqlite3.Connection, 
+        table: str, 
+        data: t.Dict[str, t.Any]
+    ) -> t.Tuple[t.Tuple[t.Tuple[str, str, int], ...], t.List[t.Any]]:
+        """Splits criteria like ``{"age__gte": 18}`` into a hashable (column, operator, arity) shape and bound params."""
+        shape, params = [], []
+        blinds, codecs = self._blinds(con, table), self._codec_map(con, table)
+        for key, value in data.items():
+            column, op = _split_predicate(key)
+            codec = codecs.get(column, self.codec)
+            encode = self._encoder(codec)
+            if column in blinds and op in ("eq", "ne", "in", "not_in"): # compare small keyed hashes through the index
+                encode, column = functools.partial(self._blind, column), column + BLIND_SUFFIX
+            if op in ("in", "not_in"):
+                if isinstance(value, (str, bytes)) or not isinstance(value, t.Iterable):
+                    raise DataBaseException(f"{op} takes a list of values, got {type(value).__name__}.")
+                value = [encode(x) for x in value]
+                shape.append((column, op, len(value)))
+                params.extend(value)
+            elif op == "is_null":
+                shape.append((column, op, int(not not value)))
+            else:
+                if op not in ("eq", "ne") and codec != "plain":
+                    raise DataBaseException(f"{op} can't be evaluated on {codec}-encoded column {column}.")
+                shape.append((column, op, 1))
+                params.append(encode(value))
+        if self.advisor is not None:
+            self.advisor.record(table, shape)
+        return tuple(shape), params
+    
+    def _select_sql(
+        self, 
+        con: sqlite3.Connection, 
+        data: t.Dict[str, t.Any], 
+        table: str, 
+        names: t.Optional[t.Iterable[str]] = None,
+        order_by: t.Optional[str] = None,
+        limit: t.Optional[int] = None,
+        skip: t.Optional[int] = None
+    ) -> t.Tuple[str, t.Tuple[t.Any, ...]]:
+        shape, params = self._where(con, table, data)
+        if not names and self._blinds(con, table): # keep shadow columns out of results
+            names = [x for x in self._schema(con, table) if not x.endswith(BLIND_SUFFIX)]
+        names = tuple(names) if names else None
+        def build() -> str:
+            condition = _where_sql(shape)
+            return f"SELECT {', '.join(names) if names else '*'} FROM {table}{' WHERE ' + condition if condition else ''}{' ORDER BY '+ order_by if order_by else ''}{' LIMIT ' + str(limit) if limit else ''}{' OFFSET ' + str(skip) if skip else ''}" + ";"
+        sql = self._statements.get(("select", table, shape, names, order_by, limit, skip), build)
+        return sql, tuple(params)
+    
+    def stream(
+        self, 
+        data: t.Dict[str, t.Any], 
+        table: str, 
+        names: t.Optional[t.Iterable[str]] = None,
+        order_by: t.Optional[str] = None,
+        limit: t.Optional[int] = None,
+        skip: t.Optional[int] = None,
+        batchsize: int = 1000
+    ) -> t.Iterator[t.Dict[str, t.Any]]:
+        """Reads on its own connection: writes made while iterating commit independently
+        (in rollback-journal mode they wait for the stream, use WAL to interleave them)."""
+        with self.reader() as con:
+            sql, params = self._select_sql(con, data, table, names, order_by, limit, skip)
+            cur = con.cursor()
+            cur.row_factory = None # plain tuples, the decoder names the values
+            cur.arraysize = batchsize
+            try:
+                cur.execute(sql, params)
+                decoder = self._decoder(con, table, cur)
+                while chunk := cur.fetchmany():
+                    yield from [decoder(x) for x in chunk]
+            finally: # the statement must not outlive the checkout
+                cur.close()
+    
+    def _columns(
+        self, 
+        cur: sqlite3.Cursor, 
+        spec: xDecodeSpecT, 
+        format: t.Literal["columns", "numpy"]
+    ) -> t.Tuple[int, t.Dict[str, t.Any]]:
+        if format == "numpy" and np is None:
+            raise DataBaseException("The numpy format requires numpy to be installed.")
+        columns = _read_columns(cur, spec, self.abc)
+        if format == "numpy":
+            columns = {x: _to_numpy(y, z) for (x, y), z in zip(columns.items(), spec[1])}
+        return len(next(iter(columns.values()), ())), columns
     
     def fetch(
         self, 
@@ -233,18 +1352,46 @@ class SqliteDatabase:
         names: t.Optional[t.Iterable[str]] = None,
         order_by: t.Optional[str] = None,
         limit: t.Optional[int] = None,
-        skip: t.Optional[int] = None
+        skip: t.Optional[int] = None,
+        format: t.Literal["rows", "columns", "numpy"] = "rows"
     ) -> DataBaseResponse:
-        with self.create_connection() as con:
-            data = {x: self._encode(y) for x, y in data.items()}
+        """``format="columns"`` returns {column: array.array or list}, ``"numpy"`` {column: ndarray}."""
+        if format != "rows":
+            assert format in ("columns", "numpy"), "Format must be either rows, columns or numpy."
+            if mode == FetchMode.FETCH_ITER:
+                raise DataBaseException("Columnar results are built in full, use FETCH_ALL.")
+            with self.connection() as con:
+                sql, params = self._select_sql(con, data, table, names, order_by, 1 if mode == FetchMode.FETCH_ONE else limit, skip)
+                cur = con.cursor()
+                cur.row_factory = None
+                cur.execute(sql, params)
+                count, columns = self._columns(cur, self._decode_spec(con, table, tuple([x[0] for x in cur.description])), format)
+            return DataBaseResponse(status=not not count, value=columns)
+        if mode == FetchMode.FETCH_ITER:
+            rows = self.stream(data, table, names, order_by, limit, skip)
+            first = next(rows, None) # status must tell whether anything matched, like the other modes
+            return DataBaseResponse(status=first is not None, value=itertools.chain([first], rows) if first is not None else None)
+        key = None
+        if self.results is not None and not self._uncommitted():
+            # typed, since 1, 1.0 and True hash alike but encode to different ciphertext
+            criteria = tuple([(x, tuple([(type(z), z) for z in y]) if isinstance(y, (list, tuple, set)) else (type(y), y)) for x, y in data.items()])
+            key = (table, criteria, int(mode), tuple(names) if names else None, order_by, limit, skip)
+            try:
+                found, result = self.results.get(key)
+            except TypeError: # unhashable criteria values, not cacheable
+                found, key = False, None
+            if found:
+                return DataBaseResponse(status=not not result, value=result if result else None)
+            generation = self.results.generation(table)
+        with self.connection() as con:
+            sql, params = self._select_sql(con, data, table, names, order_by, limit, skip)
             cur = con.cursor()
-            condition = " AND ".join([f"{x}=?" for x in data.keys()])
-            sql = f"SELECT {', '.join(names) if names else '*'} FROM {table}{' WHERE ' + condition if data != {} else ''}{' ORDER BY '+ order_by if order_by else ''}{' LIMIT ' + str(limit) if limit else ''}{' OFFSET ' + str(skip) if skip else ''}" + ";"
-            cur.execute(sql, tuple([x for x in data.values()]))
-            columns = {x: y for sub in [x for x in Table(table, db=self).columns.values()] for x, y in sub.items()} # type: ignore
-            result = [{z: self._decode(y) for z, y in x.items()} for x in [dict(x) for x in cur.fetchall()]]
-            result = [{z: int(j) if columns.get(z) in INTEGERS else float(j) if columns.get(z) in REAL else not not j if columns.get(z) in BOOL else self.to_datetime(j) if columns.get(z) in DATE else j for z, j in x.items()} for x in result] # table type checkings
-            result = result[0] if mode == 1 and result else result
+            cur.row_factory = None # plain tuples, the decoder names the values
+            cur.execute(sql, params)
+            result = self._decode_rows(con, table, cur, cur.fetchmany(1) if mode == FetchMode.FETCH_ONE else cur.fetchall())
+            result = result[0] if mode == FetchMode.FETCH_ONE and result else result
+        if key is not None:
+            self.results.put(key, table, result, generation) # type: ignore
         return DataBaseResponse(status=not not result, value=result if result else None)
     
     def remove(
@@ -252,47 +1399,86 @@ class SqliteDatabase:
         data: xInputDataT, 
         table: str, 
         limit: t.Optional[int] = None,
-        skip: t.Optional[int] = None
+        skip: t.Optional[int] = None,
+        chunksize: int = 500
     ) -> DataBaseResponse:
-        with self.create_connection() as con:
-            if isinstance(data, list):
-                for x in data:
-                    self.remove(data=x, table=table, limit=limit)
-                return DataBaseResponse(status=True, value=len(data))
-            else:
-                data = {x: self._encode(y) for x, y in data.items()}
-                cur = con.cursor()
-                condition = " AND ".join([f"{x}=?" for x in data.keys()])
-                sql = f"DELETE FROM {table} {'WHERE ' + condition if data != {} else ''}" + (f" LIMIT {limit};" if limit else ";")
-                cur.execute(sql, tuple([x for x in data.values()]))
-                con.commit()
-        return DataBaseResponse(status=not not cur.rowcount, value=cur.rowcount if cur.rowcount else None)
+        rows = [data] if isinstance(data, dict) else data
+        bounds = f"{f' LIMIT {limit}' if limit else ' LIMIT -1' if skip else ''}{f' OFFSET {skip}' if skip else ''}"
+        rowcount = 0
+        with self.connection() as con: # one transaction for the whole list
+            cur = con.cursor()
+            blinds = self._blinds(con, table)
+            for keys, group in itertools.groupby(rows, key=lambda x: tuple(x.keys())):
+                columns = tuple([_split_predicate(x) for x in keys])
+                if keys and not bounds and all([x[1] == "eq" for x in columns]): # shared equality keys, delete by IN (...) batches
+                    encoders = [functools.partial(self._blind, x[0]) if x[0] in blinds else y for x, y in zip(columns, self._encoders(con, table, [x[0] for x in columns]))]
+                    columns = tuple([x[0] + BLIND_SUFFIX if x[0] in blinds else x[0] for x in columns])
+                    if self.advisor is not None:
+                        self.advisor.record(table, [(x, "in", 1) for x in columns])
+                    params = ([f(y) for f, y in zip(encoders, x.values())] for x in group)
+                    for chunk in _chunked(params, max(chunksize // len(keys), 1)):
+                        sql = self._statements.get(("delete_in", table, columns, len(chunk)), lambda: _delete_in_sql(table, columns, len(chunk)))
+                        cur.execute(sql, [y for x in chunk for y in x])
+                        rowcount += cur.rowcount
+                    continue
+                for shape, batch in itertools.groupby((self._where(con, table, x) for x in group), key=lambda x: x[0]):
+                    sql = self._statements.get(("delete", table, shape, bounds), lambda: f"DELETE FROM {table}{' WHERE ' + _where_sql(shape) if shape else ''}{bounds};")
+                    for chunk in _chunked((x[1] for x in batch), chunksize):
+                        cur.executemany(sql, chunk)
+                        rowcount += cur.rowcount
+            self._touch(table)
+        return DataBaseResponse(status=not not rowcount, value=rowcount if rowcount else None)
     
-    def add(
+    def _insert(
         self, 
         data: xInputDataT, 
-        table: str
+        table: str, 
+        chunksize: int, 
+        conflict_column: t.Optional[str] = None
     ) -> DataBaseResponse:
-        with self.create_connection() as con:
+        rows = [data] if isinstance(data, dict) else data
+        assert all([isinstance(x, str) for sub in rows for x in sub.keys()]), "Only strings can be keys."
+        with self.connection() as con:
+            if errors := self._validator(con, table)(rows):
+                return DataBaseResponse(status=False, value=None, errors=errors)
             cur = con.cursor()
-            raw_data = data
-            if isinstance(data, dict):
-                assert all([isinstance(x, str) for x in data.keys()]), "Only strings can be keys."
-                data = {x: self._encode(y) for x, y in data.items()}
-                values = f"{str(tuple([x for x in data.values()]))};".replace(",)", ")")
-            else: # isinstance(data, list)
-                assert all([isinstance(x, str) for sub in data for x in sub.keys()]), "Only strings can be keys."
-                data = [{z: self._encode(y) for z, y in x.items()} for x in data]
-                values = f"{str([tuple([x for x in x.values()]) for x in data])[1:-1]};".replace(",)", ")")
-            columns = Table(table, db=self).columns
-            columns_dct = {x: y for sub in [x for x in columns.values()] for x, y in sub.items()} # type: ignore
-            if self.add_typecheck(raw_data, columns_dct):
-                columns = f"({', '.join([list(x.keys())[0] for x in columns.values()])})" # type: ignore
-                sql = f"INSERT INTO {table} {columns} VALUES {values}"
-                cur.execute(sql)
-                con.commit()
-                return DataBaseResponse(status=not not cur.rowcount, value=raw_data)
-            return DataBaseResponse(status=False, value=None)
+            rowcount = 0
+            blinds, codecs = self._blinds(con, table), self._codec_map(con, table)
+            pipelined = self.encode_workers and len(rows) >= self.encode_threshold
+            for keys, group in itertools.groupby(rows, key=lambda x: tuple(x.keys())):
+                assert conflict_column is None or conflict_column in keys, f"Every row must contain conflict column {conflict_column}."
+                blind = tuple([x for x in keys if x in blinds])
+                columns = keys + tuple([x + BLIND_SUFFIX for x in blind])
+                sql = self._statements.get(("insert", table, columns, conflict_column), lambda: _insert_sql(table, columns, conflict_column))
+                chunks = _chunked(group, chunksize) # bounds memory of encoded params, not the sql text
+                spec = (tuple([codecs.get(x, self.codec) for x in keys]), blind, self.storage)
+                if pipelined and (blind or any([x != "plain" for x in spec[0]])): # this thread only writes while workers encode
+                    params = self._encode_pipelined(spec, chunks)
+                else:
+                    encoders = self._encoders(con, table, keys)
+                    params = ([tuple([f(y) for f, y in zip(encoders, x.values())] + [self._blind(z, x[z]) for z in blind]) for x in chunk] for chunk in chunks)
+                for chunk in params:
+                    cur.executemany(sql, chunk)
+                    rowcount += cur.rowcount
+            self._touch(table)
+        return DataBaseResponse(status=not not rowcount, value=data)
+    
+    def add(
+        self, 
+        data: xInputDataT, 
+        table: str,
+        chunksize: int = 10_000
+    ) -> t.Union[DataBaseResponse, "concurrent.futures.Future[DataBaseResponse]"]:
+        """In write-behind mode returns a future resolving once the write is committed.
+        Inside ``transaction()`` (or any held connection) the queue is bypassed, the write joins
+        the caller's unit of work and the returned future is already resolved."""
+        if self.writer is not None:
+            if not self.pool.holding:
+                return self.writer.submit(data, table, chunksize)
+            future: concurrent.futures.Future[DataBaseResponse] = concurrent.futures.Future()
+            future.set_result(self._insert(data, table, chunksize)) # errors raise here, so the block rolls back
+            return future
+        return self._insert(data, table, chunksize)
     
     def update(
         self, 
@@ -301,24 +1487,139 @@ class SqliteDatabase:
         table: str, 
         limit: t.Optional[int] = None
     ) -> DataBaseResponse:
-        with self.create_connection() as con:
-            to_replace = {x: self._encode(y) for x, y in to_replace.items()}
-            assert all([isinstance(x, str) for x in to_replace.keys()]), "Only strings can be keys."
-            data = {x: self._encode(y) for x, y in data.items()}
-            assert all([isinstance(x, str) for x in data.keys()]), "Only strings can be keys."
-            values = ", ".join([f"{x} = {y}" if isinstance(y, int) else f"{x} = '{y}'" for x, y in data.items()])
-            if values:
-                cur = con.cursor()
-                condition = " AND ".join([f"{x}=?" for x in to_replace.keys()])
-                sql = f"UPDATE {table} SET {values}{' WHERE ' + condition if condition else ''}{f' LIMIT {limit}' if limit else ''};"
-                cur.execute(sql, tuple([x for x in to_replace.values()]))
-                return DataBaseResponse(status=not not cur.rowcount, value=cur.rowcount)
+        assert all([isinstance(x, str) for x in to_replace.keys()]), "Only strings can be keys."
+        assert all([isinstance(x, str) for x in data.keys()]), "Only strings can be keys."
+        if not data:
             raise DataBaseException("Empty data to replace")
+        with self.connection() as con: # committed on release, like every other write
+            shape, params = self._where(con, table, to_replace)
+            blinds = self._blinds(con, table)
+            data = {x: f(y) for f, (x, y) in zip(self._encoders(con, table, data), data.items())} | {x + BLIND_SUFFIX: self._blind(x, y) for x, y in data.items() if x in blinds}
+            def build() -> str:
+                values = ", ".join([f"{x} = ?" for x in data.keys()])
+                condition = _where_sql(shape)
+                return f"UPDATE {table} SET {values}{' WHERE ' + condition if condition else ''}{f' LIMIT {limit}' if limit else ''};"
+            sql = self._statements.get(("update", table, tuple(data.keys()), shape, limit), build)
+            cur = con.cursor()
+            cur.execute(sql, tuple([x for x in data.values()] + params))
+            self._touch(table)
+        return DataBaseResponse(status=not not cur.rowcount, value=cur.rowcount)
     
     def upsert(
         self,
-        data: t.Dict[str, t.Any],
+        data: xInputDataT,
         table: str,
-        conflict_column: str
+        conflict_column: str,
+        chunksize: int = 10_000
     ) -> DataBaseResponse:
-        ...
+        """``conflict_column`` must carry a UNIQUE or PRIMARY KEY constraint."""
+        return self._insert(data, table, chunksize, conflict_column)
+
+
+class AsyncSqliteDatabase:
+    """Awaitable front-end for SqliteDatabase, running every call on dedicated worker threads.
+
+    ``max_pending`` bounds the calls queued for the workers, further callers wait
+    for a free slot instead of piling up work (back-pressure for bulk ``add``).
+    ``max_streams`` bounds the open ``stream`` cursors, each keeping a connection checked out.
+    """
+    def __init__(self, *args, workers: int = 1, max_pending: int = 64, max_streams: int = 8, **kwargs) -> None:
+        self.db = SqliteDatabase(*args, **kwargs)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix="SSqlite")
+        self._pending = asyncio.Semaphore(max_pending)
+        self._streams = asyncio.Semaphore(max_streams)
+    
+    async def __aenter__(self) -> "AsyncSqliteDatabase":
+        return self
+    
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+    
+    async def _run(self, func: t.Callable[..., t.Any], *args, **kwargs) -> t.Any:
+        async with self._pending:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+    
+    async def tables(self) -> t.List[Table]:
+        return await self._run(lambda: self.db.tables)
+    
+    async def table(self, name: str, *columns, codecs: t.Optional[t.Dict[str, str]] = None) -> Table:
+        return await self._run(self.db.table, name, *columns, codecs=codecs)
+    
+    async def drop_table(self, name: str) -> bool:
+        return await self._run(self.db.drop_table, name)
+    
+    async def schema(self, table: str) -> t.Dict[str, str]:
+        return await self._run(self.db.schema, table)
+    
+    async def validate(self, data: xInputDataT, table: str) -> t.List[RowError]:
+        return await self._run(self.db.validate, data, table)
+    
+    async def execute(self, query: str, format: t.Literal["rows", "columns", "numpy"] = "rows") -> DataBaseResponse:
+        return await self._run(self.db.execute, query, format)
+    
+    async def fetch(
+        self, 
+        data: t.Dict[str, t.Any], 
+        table: str, 
+        mode: int = FetchMode.FETCH_ONE,
+        names: t.Optional[t.Iterable[str]] = None,
+        order_by: t.Optional[str] = None,
+        limit: t.Optional[int] = None,
+        skip: t.Optional[int] = None,
+        format: t.Literal["rows", "columns", "numpy"] = "rows"
+    ) -> DataBaseResponse:
+        if mode == FetchMode.FETCH_ITER:
+            raise DataBaseException("Use AsyncSqliteDatabase.stream for lazy iteration.")
+        return await self._run(self.db.fetch, data, table, mode, names, order_by, limit, skip, format)
+    
+    async def stream(
+        self, 
+        data: t.Dict[str, t.Any], 
+        table: str, 
+        names: t.Optional[t.Iterable[str]] = None,
+        order_by: t.Optional[str] = None,
+        limit: t.Optional[int] = None,
+        skip: t.Optional[int] = None,
+        batchsize: int = 1000
+    ) -> t.AsyncIterator[t.Dict[str, t.Any]]:
+        # batches run on the shared workers, the cursor's reader handle is not bound to any of them
+        async with self._streams:
+            rows = self.db.stream(data, table, names, order_by, limit, skip, batchsize)
+            try:
+                while batch := await self._run(lambda: list(itertools.islice(rows, batchsize))):
+                    for row in batch:
+                        yield row
+            finally:
+                await self._run(rows.close)
+    
+    async def remove(
+        self, 
+        data: xInputDataT, 
+        table: str, 
+        limit: t.Optional[int] = None,
+        skip: t.Optional[int] = None,
+        chunksize: int = 500
+    ) -> DataBaseResponse:
+        return await self._run(self.db.remove, data, table, limit, skip, chunksize)
+    
+    async def add(self, data: xInputDataT, table: str, chunksize: int = 10_000) -> DataBaseResponse:
+        response = await self._run(self.db.add, data, table, chunksize)
+        if isinstance(response, concurrent.futures.Future): # write-behind mode
+            return await asyncio.wrap_future(response)
+        return response
+    
+    async def update(
+        self, 
+        to_replace: t.Dict[str, t.Any], 
+        data: t.Dict[str, t.Any], 
+        table: str, 
+        limit: t.Optional[int] = None
+    ) -> DataBaseResponse:
+        return await self._run(self.db.update, to_replace, data, table, limit)
+    
+    async def upsert(self, data: xInputDataT, table: str, conflict_column: str, chunksize: int = 10_000) -> DataBaseResponse:
+        return await self._run(self.db.upsert, data, table, conflict_column, chunksize)
+    
+    async def close(self) -> None:
+        await self._run(self.db.close)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,45 @@
+"""Bulk-load through SqliteDatabase.add: rows/sec for list inserts of growing size.
+
+    python bench/bulk_insert.py [--sizes 1000 100000 1000000] [--chunksize 10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SSqlite import SqliteDatabase
+
+
+def run(label, size, chunksize, **kwargs):
+    rows = [{"id": x, "name": f"n{x}", "score": x * 0.5} for x in range(size)]
+    with tempfile.TemporaryDirectory() as folder:
+        db = SqliteDatabase(os.path.join(folder, "bulk.db"), **kwargs)
+        db.table("t", "id INT", "name TEXT", "score REAL")
+        start = time.perf_counter()
+        response = db.add(rows, "t", chunksize)
+        elapsed = time.perf_counter() - start
+        db.close()
+    print(f"{label:30} {size:>10,} rows {size / elapsed:>12,.0f} rows/s  {elapsed:7.3f}s" + ("" if response.status else "  FAILED"))
+    return not response.status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--chunksize", type=int, default=10_000, help="rows per executemany batch")
+    args = parser.parse_args()
+    failed = 0
+    for size in args.sizes:
+        for label, kwargs in [
+            ("default", {}),
+            ("throughput profile", {"profile": "throughput"}),
+        ]:
+            failed += run(label, size, args.chunksize, **kwargs)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Secure-mode codec throughput: MB/s for encrypt+decrypt round trips of 1KB, 64KB and 1MB values.
+
+    python bench/cipher.py [--sizes 1024 65536 1048576] [--seconds 1]
+"""
+import argparse
+import base64
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import SSqlite
+from SSqlite import Abc
+
+
+def run(label, size, seconds, roundtrip):
+    value = "".join(random.Random(size).choices(string.printable, k=size))
+    count, start = 0, time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        if roundtrip(value) != value:
+            raise AssertionError(f"{label}: round trip changed the value")
+        count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:24} {size:>9,} B {count * size / elapsed / 2**20:>10,.1f} MB/s  {elapsed / count * 1000:9.3f} ms/value")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[2**10, 2**16, 2**20])
+    parser.add_argument("--seconds", type=float, default=1.0, help="time spent per size and codec")
+    args = parser.parse_args()
+    abc = Abc("password")
+    np, SSqlite.np = SSqlite.np, None # ciphers built now take the pure-Python keystream
+    python = Abc("password")
+    SSqlite.np = np
+    codecs = [
+        ("text, pure Python", lambda x: python.decrypt(base64.b64encode(python.encrypt(x)).decode("ascii"))),
+        ("blob", lambda x: abc.decrypt_bytes(abc.encrypt_bytes(x.encode())).decode()),
+    ]
+    if np is not None:
+        codecs.insert(1, ("text, numpy", lambda x: abc.decrypt(base64.b64encode(abc.encrypt(x)).decode("ascii"))))
+    for size in args.sizes:
+        for label, roundtrip in codecs:
+            run(label, size, args.seconds, roundtrip)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Single-thread fetch loop: ops/sec with a connection per call versus the shared pool.
+
+    python bench/fetch_loop.py [--calls 10000] [--rows 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SSqlite import SqliteDatabase
+
+
+def run(label, calls, rows, **kwargs):
+    with tempfile.TemporaryDirectory() as folder:
+        db = SqliteDatabase(os.path.join(folder, "fetch.db"), **kwargs)
+        db.table("t", "id INT", "name TEXT")
+        db.execute("CREATE INDEX ix_t_id ON t(id);")
+        db.add([{"id": x, "name": f"n{x}"} for x in range(rows)], "t")
+        rng = random.Random(0)
+        keys = [rng.randrange(rows) for _ in range(calls)]
+        start = time.perf_counter()
+        for key in keys:
+            db.fetch({"id": key}, "t")
+        elapsed = time.perf_counter() - start
+        db.close()
+    print(f"{label:40} {calls / elapsed:>10,.0f} ops/s  {elapsed:7.3f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--rows", type=int, default=10_000)
+    args = parser.parse_args()
+    for label, kwargs in [
+        ("connect per call (pool_timeout=0)", {"pool_timeout": 0}), # every idle handle is evicted before reuse
+        ("shared pool", {}),
+        ("threadsafe (per-thread, WAL)", {"threadsafe": True}),
+    ]:
+        run(label, args.calls, args.rows, **kwargs)
+
+
+if __name__ == "__main__":
+    main()
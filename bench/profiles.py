@@ -0,0 +1,55 @@
+"""PRAGMA profile matrix: single-row inserts, bulk insert and point fetches per profile.
+
+    python bench/profiles.py [--inserts 2000] [--bulk 100000] [--fetches 10000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SSqlite import PROFILES, SqliteDatabase
+
+
+def timed(func, count):
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+def run(profile, inserts, bulk, fetches):
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "profiles.db")
+        db = SqliteDatabase(path, profile=None if profile == "readonly" else profile) # readonly only gets to read
+        db.table("t", "id INT", "name TEXT")
+        db.execute("CREATE INDEX ix_t_id ON t(id);")
+        single = timed(lambda: [db.add({"id": -x, "name": "w"}, "t") for x in range(inserts)], inserts) if profile != "readonly" else None
+        many = timed(lambda: db.add([{"id": x, "name": f"n{x}"} for x in range(bulk)], "t"), bulk) if profile != "readonly" else None
+        if profile == "readonly":
+            db.add([{"id": x, "name": f"n{x}"} for x in range(bulk)], "t")
+            db.close()
+            db = SqliteDatabase(path, profile=profile)
+        rng = random.Random(0)
+        keys = [rng.randrange(bulk) for _ in range(fetches)]
+        reads = timed(lambda: [db.fetch({"id": x}, "t") for x in keys], fetches)
+        db.close()
+    cells = [f"{x:>12,.0f}" if x is not None else f"{'-':>12}" for x in (single, many, reads)]
+    print(f"{profile or 'sqlite defaults':16} {'  '.join(cells)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inserts", type=int, default=2_000, help="add() calls, one commit each")
+    parser.add_argument("--bulk", type=int, default=100_000, help="rows in one list add()")
+    parser.add_argument("--fetches", type=int, default=10_000, help="indexed point fetches")
+    args = parser.parse_args()
+    print(f"{'profile':16} {'inserts/s':>12}  {'bulk rows/s':>12}  {'fetches/s':>12}")
+    for profile in [None, *PROFILES]:
+        run(profile, args.inserts, args.bulk, args.fetches)
+
+
+if __name__ == "__main__":
+    main()
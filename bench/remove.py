@@ -0,0 +1,52 @@
+"""Deletes/sec for SqliteDatabase.remove: one call per record versus batched list removals.
+
+    python bench/remove.py [--rows 50000] [--single 2000] [--chunksize 500]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SSqlite import SqliteDatabase
+
+
+def run(label, rows, remove, **kwargs):
+    with tempfile.TemporaryDirectory() as folder:
+        db = SqliteDatabase(os.path.join(folder, "remove.db"), **kwargs)
+        db.table("t", "id INT", "name TEXT")
+        db.execute("CREATE INDEX ix_t_id ON t(id);")
+        db.add([{"id": x, "name": f"n{x}"} for x in range(rows)], "t")
+        start = time.perf_counter()
+        remove(db, rows)
+        elapsed = time.perf_counter() - start
+        left = len(db.table("t", "id INT", "name TEXT"))
+        db.close()
+    print(f"{label:36} {rows:>8,} rows {rows / elapsed:>12,.0f} deletes/s  {elapsed:7.3f}s" + (f"  LEFT={left}" if left else ""))
+    return left
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--single", type=int, default=2_000, help="rows for the call-per-record baseline")
+    parser.add_argument("--chunksize", type=int, default=500, help="criteria per batched DELETE")
+    args = parser.parse_args()
+    def single(db, rows):
+        for x in range(rows):
+            db.remove({"id": x}, "t")
+    failed = 0
+    for label, rows, remove in [
+        ("one remove() per record", args.single, single),
+        ("list of criteria, same keys", args.rows, lambda db, rows: db.remove([{"id": x} for x in range(rows)], "t", chunksize=args.chunksize)),
+        ("list of criteria, mixed keys", args.rows, lambda db, rows: db.remove([{"id": x} if x % 2 else {"id": x, "name": f"n{x}"} for x in range(rows)], "t", chunksize=args.chunksize)),
+        ("range predicate (id__lt)", args.rows, lambda db, rows: db.remove({"id__lt": rows}, "t")),
+    ]:
+        failed += run(label, rows, remove)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
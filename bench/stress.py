@@ -0,0 +1,63 @@
+"""32-thread stress run against one SqliteDatabase: prints aggregate QPS and errors.
+
+    python bench/stress.py [--threads 32] [--seconds 3] [--writes 0.05]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SSqlite import SqliteDatabase
+
+
+def run(label, threads, seconds, writes, **kwargs):
+    with tempfile.TemporaryDirectory() as folder:
+        db = SqliteDatabase(os.path.join(folder, "stress.db"), **kwargs)
+        db.table("t", "id INT", "name TEXT")
+        db.execute("CREATE INDEX ix_t_id ON t(id);")
+        db.add([{"id": x, "name": f"n{x}"} for x in range(10_000)], "t")
+        counts, errors = [0] * threads, []
+        stop = time.monotonic() + seconds
+        def work(index):
+            rng = random.Random(index)
+            while time.monotonic() < stop:
+                try:
+                    if rng.random() < writes:
+                        db.add({"id": rng.randrange(10**6), "name": "w"}, "t")
+                    elif not db.fetch({"id": rng.randrange(10_000)}, "t").status:
+                        raise AssertionError("seeded row not found")
+                    counts[index] += 1
+                except Exception as e:
+                    errors.append(e)
+        workers = [threading.Thread(target=work, args=(x,)) for x in range(threads)]
+        [x.start() for x in workers]
+        [x.join() for x in workers]
+        db.close()
+    print(f"{label:40} {sum(counts) / seconds:>10,.0f} QPS  errors={len(errors)}" + (f"  first={errors[0]!r}" if errors else ""))
+    return len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--writes", type=float, default=0.05, help="share of operations that are writes")
+    args = parser.parse_args()
+    failed = 0
+    for label, writes, kwargs in [
+        ("shared pool, reads", 0.0, {}),
+        ("threadsafe (per-thread, WAL), reads", 0.0, {"threadsafe": True}),
+        (f"shared pool, {args.writes:.0%} writes", args.writes, {}),
+        (f"threadsafe (per-thread, WAL), {args.writes:.0%} writes", args.writes, {"threadsafe": True}),
+    ]:
+        failed += run(label, args.threads, args.seconds, writes, **kwargs)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
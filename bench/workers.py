@@ -0,0 +1,46 @@
+"""Secure-mode FETCH_ALL decode scaling: rows/sec with 1, 2, 4 and 8 decode processes.
+
+    python bench/workers.py [--rows 200000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SSqlite import FetchMode, SqliteDatabase
+
+
+def run(path, rows, workers):
+    db = SqliteDatabase(path, "secure", "password", decode_workers=workers if workers > 1 else 0, decode_threshold=1)
+    db.fetch({}, "t", FetchMode.FETCH_ALL, limit=workers * 8) # starts the worker processes outside the timing
+    start = time.perf_counter()
+    count = len(db.fetch({}, "t", FetchMode.FETCH_ALL).value)
+    elapsed = time.perf_counter() - start
+    db.close()
+    print(f"{workers:>2} worker{'s' if workers > 1 else ' '} {count:>10,} rows {count / elapsed:>12,.0f} rows/s  {elapsed:7.3f}s")
+    return count != rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="1 decodes in-process")
+    args = parser.parse_args()
+    print(f"{os.cpu_count()} CPUs, no scaling past that")
+    failed = 0
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "workers.db")
+        db = SqliteDatabase(path, "secure", "password")
+        db.table("t", "id INT", "name TEXT", "score REAL")
+        db.add([{"id": x, "name": f"name number {x}", "score": x * 0.5} for x in range(args.rows)], "t")
+        db.close()
+        for workers in args.workers:
+            failed += run(path, args.rows, workers)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
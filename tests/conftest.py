@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from SSqlite import SqliteDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"))
+    db.table("t", "id INT", "name TEXT")
+    db.add([{"id": x, "name": f"n{x}"} for x in range(10)], "t")
+    yield db
+    db.close()
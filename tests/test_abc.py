@@ -0,0 +1,41 @@
+import base64
+
+import pytest
+
+import SSqlite
+from SSqlite import Abc
+
+
+def legacy_encrypt(abc: Abc, message: str) -> bytes:
+    # the original key-extension loop, kept verbatim to pin the ciphertext format
+    data = [list(map(ord, message)), list(map(ord, abc.key))]
+    [data.__setitem__(1, [data[1][0:len(data[0])], data[1] + data[1][::-1]][len(data[1])<len(data[0])]) for x in enumerate(data[0])]
+    return "".join(map(chr, [data[0][x] + data[1][x] * 27 for x, _ in enumerate(data[0])])).encode()
+
+
+def legacy_decrypt(abc: Abc, message: str) -> str:
+    data = [list(map(ord, base64.b64decode(message).decode())), list(map(ord, abc.key))]
+    [data.__setitem__(1, [data[1][0:len(data[0])], data[1]+data[1][::-1]][len(data[1])<len(data[0])]) for x in enumerate(data[0])]
+    return "".join(map(chr, [abs(data[0][x] - 27 * data[1][x]) for x, _ in enumerate(data[0])]))
+
+
+MESSAGES = ["a", "hello world", "ünïcödé ✓", "x" * 63, "y" * 64, "z" * 1000, "mixed 🐍 " * 300]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def abc(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        return Abc("password")
+    monkeypatch.setattr(SSqlite, "np", None) # pure-Python branch even where numpy is installed
+    abc = Abc("password")
+    assert abc._period_array is None
+    return abc
+
+
+@pytest.mark.parametrize("message", MESSAGES)
+def test_abc_matches_legacy_algorithm(abc, message):
+    encrypted = abc.encrypt(message)
+    assert encrypted == legacy_encrypt(abc, message)
+    token = base64.b64encode(encrypted).decode()
+    assert abc.decrypt(token) == legacy_decrypt(abc, token) == message
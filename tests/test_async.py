@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+import pytest
+
+from SSqlite import AsyncSqliteDatabase, DataBaseException, FetchMode
+
+
+def test_async_roundtrip(tmp_path):
+    async def main():
+        async with AsyncSqliteDatabase(str(tmp_path / "test.db"), "secure", "pw", workers=2, max_pending=4) as db:
+            await db.table("t", "id INT", "name TEXT")
+            await asyncio.gather(*[db.add({"id": x, "name": f"n{x}"}, "t") for x in range(20)])
+            assert (await db.fetch({"id": 3}, "t")).value == {"id": 3, "name": "n3"}
+            assert (await db.update({"id": 3}, {"name": "x"}, "t")).value == 1
+            assert (await db.remove({"id": 4}, "t")).value == 1
+            assert sorted([x["id"] async for x in db.stream({}, "t", batchsize=3)]) == [x for x in range(20) if x != 4]
+            with pytest.raises(DataBaseException):
+                await db.fetch({}, "t", FetchMode.FETCH_ITER)
+    asyncio.run(main())
+
+
+def test_async_write_behind(tmp_path):
+    async def main():
+        async with AsyncSqliteDatabase(str(tmp_path / "test.db"), write_behind=True) as db:
+            await db.table("t", "id INT")
+            responses = await asyncio.gather(*[db.add({"id": x}, "t") for x in range(50)])
+            assert all([x.status for x in responses])
+            assert len((await db.fetch({}, "t", FetchMode.FETCH_ALL)).value) == 50
+    asyncio.run(main())
+
+
+def test_async_streams_are_bounded(tmp_path):
+    async def main():
+        async with AsyncSqliteDatabase(str(tmp_path / "test.db"), max_streams=1) as db:
+            await db.table("t", "id INT")
+            await db.add([{"id": x} for x in range(10)], "t")
+            first = db.stream({}, "t", batchsize=2)
+            assert (await first.__anext__())["id"] == 0
+            second = asyncio.ensure_future(db.stream({}, "t").__anext__())
+            await asyncio.sleep(0.1)
+            assert not second.done()
+            assert (await db.fetch({"id": 9}, "t")).value == {"id": 9} # the worker is free between batches
+            await first.aclose()
+            assert (await asyncio.wait_for(second, 5))["id"] == 0
+            assert not [x for x in threading.enumerate() if x.name.startswith("SSqlite-stream")]
+    asyncio.run(main())
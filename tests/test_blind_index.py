@@ -0,0 +1,23 @@
+import pytest
+
+from SSqlite import DataBaseException, FetchMode, SqliteDatabase
+
+
+def test_blind_index_lookups(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), "secure", "pw")
+    db.table("u", "id INT", "email TEXT")
+    db.add([{"id": x, "email": f"u{x}@x"} for x in range(50)], "u")
+    assert db.blind_index("u", "email") == "email__bidx"
+    assert db.fetch({"email": "u7@x"}, "u").value == {"id": 7, "email": "u7@x"}
+    plan = db.execute("EXPLAIN QUERY PLAN SELECT * FROM u WHERE email__bidx = x'00'").value
+    assert "USING INDEX ix_u_email__bidx" in plan[0]["detail"]
+    db.add({"id": 100, "email": "new@x"}, "u")
+    assert db.fetch({"email__in": ["new@x", "u1@x"]}, "u", FetchMode.FETCH_ALL).value.__len__() == 2
+    db.update({"email": "u7@x"}, {"email": "seven@x"}, "u")
+    assert db.fetch({"email": "seven@x"}, "u").value["id"] == 7
+    assert db.remove([{"email": "seven@x"}, {"email": "u8@x"}], "u").value == 2
+
+
+def test_blind_index_needs_a_secure_column(db):
+    with pytest.raises(DataBaseException):
+        db.blind_index("t", "name")
@@ -0,0 +1,30 @@
+import pytest
+
+from SSqlite import DataBaseException, FetchMode, SqliteDatabase
+
+
+def test_per_column_codecs(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), encpwd="pw")
+    table = db.table("u", "id INT", "email TEXT", "bio TEXT", codecs={"email": "secure", "bio": "compressed"})
+    db.add([{"id": x, "email": f"u{x}@x", "bio": "text " * 20} for x in range(50)], "u")
+    assert table.codecs == {"id": "plain", "email": "secure", "bio": "compressed"}
+    assert db.execute("SELECT typeof(id) a, typeof(bio) b FROM u LIMIT 1").value == [{"a": "integer", "b": "blob"}]
+    assert len(db.fetch({"id__gte": 40}, "u", FetchMode.FETCH_ALL).value) == 10
+    assert db.fetch({"email": "u7@x"}, "u").value == {"id": 7, "email": "u7@x", "bio": "text " * 20}
+    with pytest.raises(DataBaseException):
+        db.fetch({"email__like": "u%"}, "u")
+    assert SqliteDatabase(db.dbpath, "b64").codecs("u") == table.codecs # recorded, not taken from the datamode
+
+
+def test_codecs_are_fixed_at_creation(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), encpwd="pw")
+    db.table("u", "id INT", "email TEXT", codecs={"email": "secure"})
+    with pytest.raises(DataBaseException):
+        db.table("u", "id INT", "email TEXT", codecs={"email": "b64"})
+    db.drop_table("u")
+    assert db.table("u", "id INT", "email TEXT", codecs={"email": "b64"}).codecs["email"] == "b64"
+
+
+def test_secure_codec_needs_a_password(tmp_path):
+    with pytest.raises(DataBaseException):
+        SqliteDatabase(str(tmp_path / "test.db")).table("u", "email TEXT", codecs={"email": "secure"})
@@ -0,0 +1,42 @@
+import pytest
+
+from SSqlite import FetchMode, SqliteDatabase
+
+
+def test_columnar_formats(db):
+    columns = db.fetch({}, "t", FetchMode.FETCH_ALL, format="columns").value
+    assert columns["id"].typecode == "q" and list(columns["id"]) == list(range(10))
+    assert columns["name"][0] == "n0"
+    assert db.fetch({"id": 3}, "t", format="columns").value == {"id": db.fetch({"id": 3}, "t", format="columns").value["id"], "name": ["n3"]}
+    raw = db.execute("SELECT id, id * 0.5 half FROM t", format="columns").value
+    assert raw["id"].typecode == "q" and raw["half"].typecode == "d"
+
+
+def test_nulls_fall_back_to_lists(db):
+    db.add({"name": "no id"}, "t")
+    assert db.fetch({}, "t", FetchMode.FETCH_ALL, format="columns").value["id"][-1] is None
+
+
+def test_numpy_format(db):
+    np = pytest.importorskip("numpy")
+    db.add({"name": "no id"}, "t")
+    columns = db.fetch({}, "t", FetchMode.FETCH_ALL, format="numpy").value
+    assert columns["id"].dtype == np.float64 and np.isnan(columns["id"][-1])
+    assert db.execute("SELECT sum(id) s FROM t", format="numpy").value["s"][0] == 45
+
+
+def test_encoded_columns_are_decoded(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), "secure", "pw")
+    db.table("t", "id INT", "score REAL")
+    db.add([{"id": x, "score": x / 4} for x in range(5)], "t")
+    columns = db.fetch({}, "t", FetchMode.FETCH_ALL, format="columns").value
+    assert list(columns["id"]) == [0, 1, 2, 3, 4] and list(columns["score"]) == [0, 0.25, 0.5, 0.75, 1.0]
+
+
+def test_columnar_raw_write_invalidates_cache(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), result_cache_bytes=2**20)
+    db.table("t", "id INT")
+    db.add({"id": 1}, "t")
+    assert db.fetch({"id": 1}, "t").value == {"id": 1}
+    assert list(db.execute("DELETE FROM t WHERE id = 1 RETURNING id", format="columns").value["id"]) == [1]
+    assert db.fetch({"id": 1}, "t").value is None
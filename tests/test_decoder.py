@@ -0,0 +1,22 @@
+import datetime
+
+from SSqlite import FetchMode, SqliteDatabase
+
+
+def test_rows_are_cast_by_declared_type(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), "b64")
+    db.table("t", "id INT", "ok BOOL", "score REAL", "born DATE", "note TEXT", "raw")
+    db.add({"id": 1, "ok": True, "score": 0.5, "born": "2020-01-02", "note": "x", "raw": "y"}, "t")
+    db.add({"id": 2}, "t")
+    first, second = db.fetch({}, "t", FetchMode.FETCH_ALL, order_by="rowid").value
+    assert first == {"id": 1, "ok": True, "score": 0.5, "born": datetime.datetime(2020, 1, 2), "note": "x", "raw": "y"}
+    assert second == {"id": 2, "ok": None, "score": None, "born": None, "note": None, "raw": None}
+
+
+def test_decoders_are_cached_per_schema_and_columns(db):
+    db.fetch({}, "t")
+    db.fetch({}, "t", names=["id"])
+    db.fetch({}, "t")
+    assert len(db._decoders) == 2
+    db.execute("ALTER TABLE t ADD COLUMN extra INT;")
+    assert db.fetch({"id": 1}, "t").value == {"id": 1, "name": "n1", "extra": None}
@@ -0,0 +1,23 @@
+from SSqlite import SqliteDatabase, Table
+
+
+def test_create_and_drop_index(db):
+    table = Table("t", db)
+    name = table.create_index(["id", "name"], unique=True)
+    assert name == "ix_t_id_name"
+    assert table.indexes == [{"name": name, "columns": ["id", "name"], "unique": True, "partial": False}]
+    assert table.create_index("name", where="name IS NOT NULL", name="ix_named") == "ix_named"
+    assert {x["name"]: x["partial"] for x in table.indexes} == {name: False, "ix_named": True}
+    assert table.drop_index(name)
+    assert not table.drop_index(name)
+    assert [x["name"] for x in table.indexes] == ["ix_named"]
+
+
+def test_index_advisor(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), index_advisor=True)
+    table = db.table("t", "a INT", "b INT")
+    db.table("t2", "a INT")
+    db.fetch({"a": 1, "b__gt": 2}, "t")
+    assert [x["columns"] for x in db.suggest_indexes()] == [["a", "b"]]
+    table.create_index(["a", "b"])
+    assert db.suggest_indexes() == []
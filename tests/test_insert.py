@@ -0,0 +1,20 @@
+from SSqlite import FetchMode
+
+
+def test_bulk_add_in_chunks(db):
+    rows = [{"id": x, "name": f"bulk{x}"} for x in range(100, 2600)]
+    response = db.add(rows, "t", chunksize=1000)
+    assert response.status and response.value is rows
+    assert len(db.fetch({"id__gte": 100}, "t", FetchMode.FETCH_ALL).value) == 2500
+
+
+def test_rows_with_different_keys(db):
+    assert db.add([{"id": 100}, {"id": 101, "name": "b"}, {"name": "c"}], "t").status
+    assert db.fetch({"id": 100}, "t").value == {"id": 100, "name": None}
+    assert db.fetch({"name": "c"}, "t").value == {"id": None, "name": "c"}
+
+
+def test_values_are_bound_not_interpolated(db):
+    name = "x'); DROP TABLE t; --"
+    assert db.add({"id": 100, "name": name}, "t").status
+    assert db.fetch({"id": 100}, "t").value["name"] == name
@@ -0,0 +1,92 @@
+import sqlite3
+import threading
+
+import pytest
+
+from SSqlite import ConnectionPool, DataBaseException, SqliteDatabase
+
+
+def test_nested_calls_reuse_the_held_connection(db):
+    with db.connection() as outer:
+        with db.connection() as inner:
+            assert inner is outer
+        assert db.pool.holding
+    assert not db.pool.holding
+
+
+def test_connections_are_reused_across_calls(db):
+    for x in range(50):
+        db.fetch({"id": x % 10}, "t")
+    assert db.pool._size == 1
+
+
+def test_pool_bounds_connections_across_threads(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), pool_size=2)
+    db.table("t", "id INT")
+    barrier = threading.Barrier(8)
+    def work():
+        barrier.wait()
+        for x in range(20):
+            db.add({"id": x}, "t")
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    [x.start() for x in threads]
+    [x.join() for x in threads]
+    assert db.pool._size <= 2
+    assert len(db.table("t", "id INT")) == 160
+
+
+def test_failed_block_rolls_back(db):
+    with pytest.raises(RuntimeError):
+        with db.connection() as con:
+            con.execute("INSERT INTO t VALUES (100, 'x');")
+            raise RuntimeError
+    assert db.fetch({"id": 100}, "t").value is None
+
+
+def test_closed_pool_refuses_checkouts(db):
+    db.close()
+    with pytest.raises(DataBaseException):
+        db.fetch({"id": 1}, "t")
+
+
+def test_tables_lists_created_tables(db):
+    assert [x.name for x in db.tables] == ["t"]
+
+
+def test_execute_cursor_is_detached(db):
+    response = db.execute("INSERT INTO t VALUES (50, 'x')")
+    assert response.cursor.rowcount == 1
+    with pytest.raises(Exception):
+        response.cursor.execute("SELECT 1")
+
+
+def test_failed_commit_is_rolled_back_before_reuse(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), profile={"busy_timeout": 50}) # rollback journal, so a reader blocks commits
+    db.table("t", "id INT")
+    db.add([{"id": x} for x in range(5000)], "t")
+    rows = db.stream({}, "t", batchsize=10)
+    next(rows) # holds a SHARED lock mid-scan
+    with pytest.raises(sqlite3.OperationalError):
+        db.add({"id": 99999}, "t")
+    rows.close()
+    assert db.add({"id": 100000}, "t").status
+    fresh = SqliteDatabase(db.dbpath)
+    assert fresh.fetch({"id": 99999}, "t").value is None
+    assert fresh.fetch({"id": 100000}, "t").value == {"id": 100000}
+
+
+def test_connection_is_discarded_when_rollback_fails_too():
+    class Broken:
+        closed = False
+        def commit(self):
+            raise sqlite3.OperationalError("database is locked")
+        def rollback(self):
+            raise sqlite3.OperationalError("disk I/O error")
+        def close(self):
+            self.closed = True
+    con = Broken()
+    pool = ConnectionPool(lambda: con, max_size=1)
+    pool.acquire()
+    with pytest.raises(sqlite3.OperationalError):
+        pool.release(con)
+    assert con.closed and pool._size == 0 and not pool._idle
@@ -0,0 +1,36 @@
+import pytest
+
+from SSqlite import DataBaseException, FetchMode, SqliteDatabase
+
+
+def test_predicates(db):
+    assert [x["id"] for x in db.fetch({"id__gte": 7}, "t", FetchMode.FETCH_ALL, order_by="id").value] == [7, 8, 9]
+    assert [x["id"] for x in db.fetch({"id__gt": 2, "id__lte": 4}, "t", FetchMode.FETCH_ALL, order_by="id").value] == [3, 4]
+    assert len(db.fetch({"id__in": [1, 2, 99]}, "t", FetchMode.FETCH_ALL).value) == 2
+    assert len(db.fetch({"id__not_in": [1, 2]}, "t", FetchMode.FETCH_ALL).value) == 8
+    assert db.fetch({"id__in": []}, "t", FetchMode.FETCH_ALL).value is None
+    assert db.fetch({"name__like": "n1%"}, "t").value["id"] == 1
+    assert db.fetch({"id__ne": 0, "id__lt": 2}, "t").value["id"] == 1
+    assert db.update({"id__gte": 8}, {"name": "big"}, "t").value == 2
+    assert db.remove({"id__lt": 5}, "t").value == 5
+
+
+def test_null_predicates(db):
+    db.add({"id": 100}, "t")
+    assert db.fetch({"name__is_null": True}, "t").value["id"] == 100
+    assert len(db.fetch({"name__is_null": False}, "t", FetchMode.FETCH_ALL).value) == 10
+
+
+def test_range_refused_on_encoded_columns(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), "b64")
+    db.table("t", "id INT")
+    with pytest.raises(DataBaseException):
+        db.fetch({"id__gt": 1}, "t")
+
+
+@pytest.mark.parametrize("value", ["12", b"12", 12])
+def test_membership_needs_a_collection(db, value):
+    with pytest.raises(DataBaseException):
+        db.fetch({"id__in": value}, "t")
+    with pytest.raises(DataBaseException):
+        db.remove({"id__not_in": value}, "t")
@@ -0,0 +1,34 @@
+import sqlite3
+
+import pytest
+
+from SSqlite import PROFILES, SqliteDatabase
+
+
+def pragmas(db, names):
+    with db.connection() as con:
+        return {x: con.execute(f"PRAGMA {x};").fetchone()[0] for x in names}
+
+
+@pytest.mark.parametrize("profile", [x for x in PROFILES if x != "readonly"])
+def test_profiles_are_applied_per_connection(tmp_path, profile):
+    db = SqliteDatabase(str(tmp_path / "test.db"), profile=profile)
+    applied = pragmas(db, ["journal_mode", "cache_size", "busy_timeout"])
+    assert applied == {"journal_mode": "wal", "cache_size": PROFILES[profile]["cache_size"], "busy_timeout": PROFILES[profile]["busy_timeout"]}
+
+
+def test_custom_pragmas_and_threadsafe_default(tmp_path):
+    assert pragmas(SqliteDatabase(str(tmp_path / "a.db"), profile={"cache_size": -1234}), ["cache_size"]) == {"cache_size": -1234}
+    assert pragmas(SqliteDatabase(str(tmp_path / "b.db"), threadsafe=True), ["journal_mode"]) == {"journal_mode": "wal"}
+
+
+def test_readonly_profile_refuses_writes(db):
+    readonly = SqliteDatabase(db.dbpath, profile="readonly")
+    assert readonly.fetch({"id": 1}, "t").status
+    with pytest.raises(sqlite3.OperationalError):
+        readonly.add({"id": 100, "name": "x"}, "t")
+
+
+def test_unknown_profile(tmp_path):
+    with pytest.raises(AssertionError):
+        SqliteDatabase(str(tmp_path / "test.db"), profile="fastest")
@@ -0,0 +1,16 @@
+from SSqlite import FetchMode
+
+
+def test_remove_list_by_single_key(db):
+    assert db.remove([{"id": x} for x in range(0, 10, 2)], "t", chunksize=2).value == 5
+    assert [x["id"] for x in db.fetch({}, "t", FetchMode.FETCH_ALL).value] == [1, 3, 5, 7, 9]
+
+
+def test_remove_list_by_several_keys(db):
+    assert db.remove([{"id": 1, "name": "n1"}, {"id": 2, "name": "wrong"}, {"id": 3, "name": "n3"}], "t").value == 2
+
+
+def test_remove_mixed_shapes_and_bounds(db):
+    assert db.remove([{"id": 1}, {"id__gte": 8}], "t").value == 3
+    assert db.remove({}, "t", limit=2).value == 2
+    assert db.remove({"id": 100}, "t").value is None
@@ -0,0 +1,52 @@
+import threading
+
+from SSqlite import SqliteDatabase
+
+
+def test_result_cache_hits_and_invalidation(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), result_cache_bytes=2**20)
+    db.table("t", "id INT")
+    db.add({"id": 1}, "t")
+    assert db.fetch({"id": 1}, "t").status and db.fetch({"id": 1}, "t").status
+    assert db.result_cache_info()["hits"] == 1
+    db.remove({"id": 1}, "t")
+    assert db.fetch({"id": 1}, "t").value is None
+    db.execute("INSERT INTO t VALUES (1)")
+    assert db.fetch({"id": 1}, "t").value == {"id": 1}
+
+
+def test_result_cache_keys_on_value_type(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), "secure", "pw", result_cache_bytes=2**20)
+    db.table("t", "n TEXT")
+    db.add({"n": "1"}, "t")
+    assert db.fetch({"n": 1}, "t").value == {"n": "1"}
+    assert db.fetch({"n": True}, "t").value is None
+    assert db.fetch({"n": 1}, "t").value == {"n": "1"}
+    db.add({"n": "2"}, "t")
+    assert db.fetch({"n": 2}, "t").value == {"n": "2"}
+
+
+def test_uncommitted_rows_never_reach_the_shared_cache(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), result_cache_bytes=2**20, threadsafe=True)
+    db.table("t", "id INT", "name TEXT")
+    inside, written, checked = [], threading.Event(), threading.Event()
+    def writer():
+        try:
+            with db.transaction():
+                db.add({"id": 1, "name": "uncommitted"}, "t")
+                inside.append(db.fetch({"id": 1}, "t").value) # sees its own write, but must not cache it
+                written.set()
+                checked.wait()
+                raise RuntimeError
+        except RuntimeError:
+            pass
+    thread = threading.Thread(target=writer)
+    thread.start()
+    written.wait()
+    try:
+        assert db.fetch({"id": 1}, "t").value is None
+    finally:
+        checked.set()
+        thread.join()
+    assert inside == [{"id": 1, "name": "uncommitted"}]
+    assert db.fetch({"id": 1}, "t").value is None
@@ -0,0 +1,13 @@
+def test_schema_is_cached_until_it_changes(db):
+    assert db.schema("t") == {"id": "INT", "name": "TEXT"}
+    with db.connection() as con:
+        first = db._schema(con, "t")
+        assert db._schema(con, "t") is first
+    db.execute("ALTER TABLE t ADD COLUMN extra REAL;")
+    assert db.schema("t") == {"id": "INT", "name": "TEXT", "extra": "REAL"}
+    assert db.add({"id": 100, "extra": 1.5}, "t").status
+    assert db.fetch({"id": 100}, "t").value["extra"] == 1.5
+
+
+def test_schema_of_missing_table_is_empty(db):
+    assert db.schema("missing") == {}
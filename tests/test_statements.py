@@ -0,0 +1,20 @@
+from SSqlite import LRUCache
+
+
+def test_statement_cache_counts_hits_per_shape(db):
+    before = db.statement_cache_info()
+    for x in range(5):
+        db.fetch({"id": x}, "t")
+    db.fetch({"name": "n1"}, "t")
+    after = db.statement_cache_info()
+    assert after["misses"] - before["misses"] == 2
+    assert after["hits"] - before["hits"] == 4
+    assert after["maxsize"] == db.statement_cache_size
+
+
+def test_lru_cache_evicts_oldest():
+    cache = LRUCache(2)
+    for x in ["a", "b", "a", "c"]:
+        cache.get(x, lambda: x.upper())
+    assert cache.info() == {"hits": 1, "misses": 3, "size": 2, "maxsize": 2}
+    assert list(cache._data) == ["a", "c"]
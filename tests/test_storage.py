@@ -0,0 +1,51 @@
+import pytest
+
+import SSqlite
+from SSqlite import Abc, DataBaseException, FetchMode, SqliteDatabase
+
+
+@pytest.mark.parametrize("numpy", [False, True])
+def test_abc_bytes_roundtrip(monkeypatch, numpy):
+    if numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(SSqlite, "np", None)
+    abc = Abc("password")
+    for data in [b"short", bytes(range(256)) * 3]:
+        encrypted = abc.encrypt_bytes(data)
+        assert len(encrypted) == len(data) and abc.decrypt_bytes(encrypted) == data
+
+
+@pytest.mark.parametrize("mode,storage", [("default", "text"), ("b64", "text"), ("b64", "blob"), ("secure", "text"), ("secure", "blob")])
+def test_roundtrip_every_mode(tmp_path, mode, storage):
+    db = SqliteDatabase(str(tmp_path / "test.db"), mode, "pw" if mode == "secure" else None, storage=storage)
+    db.table("t", "id INT", "score REAL", "name TEXT", "born DATE")
+    rows = [{"id": x, "score": x / 2, "name": f"nämé {x}", "born": "2020-01-02"} for x in range(20)]
+    assert db.add(rows, "t").status
+    found = db.fetch({"id": 3}, "t").value
+    assert found["id"] == 3 and found["score"] == 1.5 and found["name"] == "nämé 3" and found["born"].year == 2020
+    assert len(db.fetch({}, "t", FetchMode.FETCH_ALL).value) == 20
+    assert db.update({"id": 3}, {"name": "changed"}, "t").value == 1
+    assert db.fetch({"name": "changed"}, "t").value["id"] == 3
+    assert db.remove([{"id": 1}, {"id": 2}], "t").value == 2
+    db.close()
+
+
+@pytest.mark.parametrize("mode", ["b64", "secure"])
+def test_migrate_storage_from_text_to_blob(tmp_path, mode):
+    path, password = str(tmp_path / "test.db"), "pw" if mode == "secure" else None
+    text = SqliteDatabase(path, mode, password)
+    text.table("t", "id INT", "name TEXT")
+    text.add([{"id": x, "name": f"name {x} " * 10} for x in range(200)], "t")
+    text.close()
+    blob = SqliteDatabase(path, mode, password, storage="blob")
+    assert blob.fetch({}, "t").value["name"] == "name 0 " * 10 # text rows stay readable, only lookups need the migration
+    response = blob.migrate_storage("t")
+    assert response.value["rows"] == 200 and response.value["size_after"] <= response.value["size_before"]
+    assert blob.execute("SELECT count(*) n FROM t WHERE typeof(name) != 'blob'").value == [{"n": 0}]
+    assert blob.fetch({"name": "name 7 " * 10}, "t").value["id"] == 7
+
+
+def test_migrate_storage_refuses_plain_tables(db):
+    with pytest.raises(DataBaseException):
+        db.migrate_storage("t")
@@ -0,0 +1,51 @@
+import gc
+import threading
+
+from SSqlite import FetchMode, SqliteDatabase
+
+
+def test_stream_and_fetch_iter(db):
+    assert [x["id"] for x in db.stream({"id__gte": 5}, "t", order_by="id", batchsize=2)] == [5, 6, 7, 8, 9]
+    response = db.fetch({}, "t", mode=FetchMode.FETCH_ITER)
+    assert response.status and len(list(response.value)) == 10
+    response = db.fetch({"id": 100}, "t", mode=FetchMode.FETCH_ITER)
+    assert not response.status and response.value is None
+
+
+def test_write_during_stream_survives_early_close(db):
+    for _ in db.stream({}, "t"):
+        assert db.add({"id": 100, "name": "x"}, "t").status
+        break
+    response = db.fetch({}, "t", mode=FetchMode.FETCH_ITER)
+    db.add({"id": 999, "name": "x"}, "t")
+    del response
+    gc.collect()
+    assert len(db.fetch({"id__in": [100, 999]}, "t", FetchMode.FETCH_ALL).value) == 2
+
+
+def test_fetch_iter_consumed_on_another_thread(db):
+    response = db.fetch({}, "t", mode=FetchMode.FETCH_ITER)
+    rows = []
+    thread = threading.Thread(target=lambda: rows.extend(response.value))
+    thread.start()
+    thread.join()
+    assert len(rows) == 10
+    db.add({"id": 100, "name": "x"}, "t")
+    assert SqliteDatabase(db.dbpath).fetch({"id": 100}, "t").value is not None
+
+
+def test_stream_inside_held_checkout_does_not_wait_on_it(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), pool_size=1)
+    db.table("t", "id INT")
+    seen = []
+    def work():
+        with db.transaction():
+            db.add({"id": 1}, "t")
+            seen.extend(db.stream({}, "t"))
+            seen.extend(db.table("t", "id INT").rows.values())
+    threads = [threading.Thread(target=work, daemon=True) for _ in range(5)]
+    [x.start() for x in threads]
+    [x.join(10) for x in threads]
+    assert not any(x.is_alive() for x in threads)
+    assert len(db.fetch({}, "t", FetchMode.FETCH_ALL).value) == 5
+    assert db.pool._size <= 1
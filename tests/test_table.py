@@ -0,0 +1,28 @@
+from SSqlite import SqliteDatabase, Table
+
+
+def test_table_is_lazy(db):
+    table = Table("t", db)
+    db.add({"id": 100, "name": "later"}, "t")
+    assert len(table) == 11
+    assert table.exists and not Table("missing", db).exists
+    assert table.columns == {1: {"id": "INT"}, 2: {"name": "TEXT"}}
+    assert table.rows[11] == {"id": 100, "name": "later"}
+    assert table.pretty_print.count("\n") == 14
+
+
+def test_iteration_streams_in_batches(db):
+    table = Table("t", db, arraysize=3)
+    assert [tuple(x) for x in table] == [(x, f"n{x}") for x in range(10)]
+
+
+def test_write_during_table_iteration_survives_break(db):
+    for _ in Table("t", db):
+        assert db.update({"id": 1}, {"name": "changed"}, "t").status
+        break
+    assert SqliteDatabase(db.dbpath).fetch({"id": 1}, "t").value["name"] == "changed"
+
+
+def test_drop(db):
+    assert db.drop_table("t")
+    assert not db.drop_table("t")
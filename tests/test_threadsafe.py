@@ -0,0 +1,47 @@
+import random
+import threading
+
+from SSqlite import SqliteDatabase
+
+
+def run_threads(db, count, seed_rows):
+    errors = []
+    def work(seed):
+        rng = random.Random(seed)
+        for _ in range(50):
+            try:
+                if rng.random() < 0.1:
+                    db.add({"id": seed_rows + seed, "name": "w"}, "t")
+                elif not db.fetch({"id": rng.randrange(seed_rows)}, "t").status:
+                    raise AssertionError("seeded row not found")
+            except Exception as e:
+                errors.append(e)
+    threads = [threading.Thread(target=work, args=(x,)) for x in range(count)]
+    [x.start() for x in threads]
+    [x.join() for x in threads]
+    return errors
+
+
+def test_threadsafe_concurrent_reads_and_writes(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), threadsafe=True)
+    db.table("t", "id INT", "name TEXT")
+    db.add([{"id": x, "name": "n"} for x in range(1000)], "t")
+    assert run_threads(db, 32, 1000) == []
+    db.close()
+
+
+def test_threadsafe_keeps_one_connection_per_thread(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), threadsafe=True)
+    db.table("t", "id INT", "name TEXT")
+    seen = []
+    def work():
+        with db.connection() as first:
+            pass
+        with db.connection() as second:
+            seen.append(first is second)
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    [x.start() for x in threads]
+    [x.join() for x in threads]
+    assert seen == [True] * 4
+    assert len(db.pool._owned) <= 5
+    db.close()
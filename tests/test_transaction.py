@@ -0,0 +1,26 @@
+import pytest
+
+
+def test_transaction_commits_once(db):
+    with db.transaction("IMMEDIATE") as con:
+        db.add({"id": 100, "name": "x"}, "t")
+        db.update({"id": 100}, {"name": "y"}, "t")
+        assert con.in_transaction
+    assert db.fetch({"id": 100}, "t").value == {"id": 100, "name": "y"}
+
+
+def test_transaction_rolls_back(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction("IMMEDIATE"):
+            db.add({"id": 100, "name": "x"}, "t")
+            raise RuntimeError
+    assert db.fetch({"id": 100}, "t").value is None
+
+
+def test_nested_transaction_joins_outer(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            with db.transaction("IMMEDIATE"):
+                db.add({"id": 100, "name": "x"}, "t")
+            raise RuntimeError
+    assert db.fetch({"id": 100}, "t").value is None
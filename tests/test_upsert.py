@@ -0,0 +1,12 @@
+import pytest
+
+from SSqlite import FetchMode, SqliteDatabase
+
+
+def test_upsert(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"))
+    db.table("t", "id INT PRIMARY KEY", "name TEXT")
+    db.upsert([{"id": 1, "name": "a"}, {"id": 1, "name": "b"}, {"id": 2, "name": "c"}], "t", "id")
+    assert db.fetch({}, "t", FetchMode.FETCH_ALL, order_by="id").value == [{"id": 1, "name": "b"}, {"id": 2, "name": "c"}]
+    with pytest.raises(AssertionError):
+        db.upsert({"name": "no key"}, "t", "id")
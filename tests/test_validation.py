@@ -0,0 +1,12 @@
+def test_validation_errors_are_returned(db):
+    response = db.add([{"id": "x", "name": "a"}, {"nope": 1}], "t")
+    assert not response.status
+    assert [(x.row, x.column) for x in response.errors] == [(0, "id"), (1, "nope")]
+    assert db.fetch({"name": "a"}, "t").value is None
+
+
+def test_validate_and_add_typecheck(db):
+    assert db.validate({"id": 1, "name": "a"}, "t") == []
+    assert db.validate([{"id": 1.5}], "t")[0].column == "id"
+    assert db.add_typecheck({"born": "2020-01-01"}, {"born": "DATE"})
+    assert not db.add_typecheck({"born": "not a date"}, {"born": "DATE"})
@@ -0,0 +1,33 @@
+from SSqlite import FetchMode, SqliteDatabase
+
+
+def test_parallel_decode_matches_in_process(tmp_path):
+    path = str(tmp_path / "test.db")
+    db = SqliteDatabase(path, "secure", "pw")
+    db.table("t", "id INT", "name TEXT", "born DATE")
+    db.add([{"id": x, "name": f"n{x}", "born": "2020-01-02"} for x in range(500)], "t")
+    expected = db.fetch({}, "t", FetchMode.FETCH_ALL, order_by="id").value
+    parallel = SqliteDatabase(path, "secure", "pw", decode_workers=2, decode_threshold=100)
+    assert parallel.fetch({}, "t", FetchMode.FETCH_ALL, order_by="id").value == expected
+    assert parallel._workers is not None
+    parallel.close()
+
+
+def test_workers_rebuild_the_cipher_from_the_hashed_key():
+    from SSqlite import Abc
+    abc = Abc("password")
+    assert Abc.from_key(abc.key).encrypt("message") == abc.encrypt("message")
+
+
+def test_parallel_encode_matches_in_process(tmp_path):
+    rows = [{"id": x, "email": f"u{x}@x", "note": "n"} for x in range(500)]
+    stored = []
+    for workers in [0, 2]:
+        db = SqliteDatabase(str(tmp_path / f"test{workers}.db"), "secure", "pw", encode_workers=workers, encode_threshold=100)
+        db.table("t", "id INT", "email TEXT", "note TEXT")
+        db.blind_index("t", "email")
+        assert db.add(rows, "t", chunksize=64).status
+        stored.append(db.execute("SELECT * FROM t ORDER BY rowid").value)
+        assert (db._workers is not None) == bool(workers)
+        db.close()
+    assert stored[0] == stored[1]
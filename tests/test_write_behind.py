@@ -0,0 +1,46 @@
+import threading
+import time
+
+import pytest
+
+from SSqlite import FetchMode, SqliteDatabase
+
+
+def test_concurrent_adds_are_group_committed(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), write_behind=True)
+    db.table("t", "id INT")
+    futures = []
+    threads = [threading.Thread(target=lambda k=k: futures.extend([db.add({"id": k * 100 + x}, "t") for x in range(100)])) for k in range(8)]
+    [x.start() for x in threads]
+    [x.join() for x in threads]
+    assert all([x.result().status for x in futures])
+    db.flush()
+    assert len(db.fetch({}, "t", FetchMode.FETCH_ALL).value) == 800
+    db.close()
+
+
+def test_failed_row_does_not_fail_its_batch(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), write_behind=True)
+    db.table("t", "id INT PRIMARY KEY")
+    good, bad = db.add({"id": 1}, "t"), db.add({"id": 1}, "t")
+    assert good.result().status
+    with pytest.raises(Exception):
+        bad.result()
+    db.close()
+
+
+def test_write_behind_inside_transaction(tmp_path):
+    db = SqliteDatabase(str(tmp_path / "test.db"), write_behind=True)
+    db.table("t", "id INT")
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.add({"id": 1}, "t")
+            raise RuntimeError
+    started = time.monotonic()
+    with db.transaction("IMMEDIATE"):
+        assert db.add({"id": 2}, "t").result().status
+    assert time.monotonic() - started < 1
+    assert db.add({"id": 3}, "t").result().status
+    db.flush()
+    assert [x["id"] for x in db.fetch({}, "t", FetchMode.FETCH_ALL).value] == [2, 3]
+    db.close()